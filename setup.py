@@ -2,7 +2,8 @@
 """Setup script for Puzzle Swap ETL project."""
 
 import asyncio
-import os
+import shutil
+import subprocess
 import sys
 from pathlib import Path
 
@@ -24,7 +25,17 @@ def check_requirements():
         return False
 
     # Check if Poetry is installed
-    if os.system("poetry --version > /dev/null 2>&1") != 0:
+    try:
+        poetry_check = subprocess.run(
+            ["poetry", "--version", "--no-ansi"],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            check=False,
+        )
+    except FileNotFoundError:
+        poetry_check = None
+
+    if poetry_check is None or poetry_check.returncode != 0:
         console.print(
             "[red]Error: Poetry is not installed. Please install Poetry first.[/red]"
         )
@@ -48,7 +59,7 @@ def setup_environment():
 
     if not env_file.exists() and env_example.exists():
         console.print("Creating .env file from template...")
-        env_file.write_text(env_example.read_text())
+        shutil.copyfile(env_example, env_file)
         console.print("[green]✓ .env file created[/green]")
 
     # Create data directories
@@ -71,7 +82,13 @@ def install_dependencies():
         task = progress.add_task("Installing dependencies...", total=None)
 
         # Install dependencies
-        result = os.system("poetry install")
+        try:
+            result = subprocess.run(
+                ["poetry", "install", "--no-interaction", "--no-ansi"],
+                check=False,
+            ).returncode
+        except FileNotFoundError:
+            result = 1
         if result != 0:
             console.print("[red]Error: Failed to install dependencies[/red]")
             return False
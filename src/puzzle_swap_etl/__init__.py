@@ -4,12 +4,19 @@ __version__ = "0.1.0"
 __author__ = "Puzzle Swap ETL Team"
 __description__ = "ETL pipeline for Puzzle Swap blockchain data extraction and analysis"
 
+from typing import Any
+
 # Import main components
 from .config import settings
 
-# Import new mapping classes
-from .mappings import AddressMapping, AssetMapping, FunctionMapping
-from .pipeline import PuzzleSwapETL
+# Heavy components are imported on first access (PEP 562) so that CLI
+# commands which only need ``settings`` don't load the whole pipeline.
+_LAZY_IMPORTS = {
+    "PuzzleSwapETL": ".pipeline",
+    "AddressMapping": ".mappings",
+    "AssetMapping": ".mappings",
+    "FunctionMapping": ".mappings",
+}
 
 __all__ = [
     "settings",
@@ -18,3 +25,19 @@ __all__ = [
     "AssetMapping",
     "FunctionMapping",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Lazily import heavy package-level components."""
+    if name in _LAZY_IMPORTS:
+        from importlib import import_module
+
+        value = getattr(import_module(_LAZY_IMPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list:
+    """List lazily importable names alongside module globals."""
+    return sorted(list(globals()) + list(_LAZY_IMPORTS))
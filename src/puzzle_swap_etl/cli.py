@@ -1,20 +1,64 @@
 """Command-line interface for the Puzzle Swap ETL pipeline."""
 
 import asyncio
+import atexit
+import os
+from collections import Counter
 from pathlib import Path
-from typing import Optional
+from typing import Any, Coroutine, Dict, Iterable, List, Optional, TypeVar
 
 import typer
+import zstandard
+from pydantic import BaseModel
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich.table import Table
 
 from puzzle_swap_etl.config import settings
-from puzzle_swap_etl.database import db_manager
-from puzzle_swap_etl.pipeline import PuzzleSwapETL
+from puzzle_swap_etl.database import get_db_manager
+from puzzle_swap_etl.utils import (
+    NDJSON_SUFFIX,
+    ZSTD_LEVEL,
+    get_logger,
+    read_ndjson_batches,
+    write_ndjson,
+)
+
+try:
+    import uvloop
+except ImportError:  # uvloop is not available on Windows
+    uvloop = None
 
 # Initialize Rich console
 console = Console()
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+# Progress display shared by all commands, started on first use
+_progress: Optional[Progress] = None
+
+
+def _get_progress() -> Progress:
+    """Return the shared progress display, starting it on first use."""
+    global _progress
+    if _progress is None:
+        _progress = Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            console=console,
+        )
+        _progress.start()
+        atexit.register(_progress.stop)
+    return _progress
+
+
+def _run(coro: Coroutine[Any, Any, T]) -> T:
+    """Run a coroutine to completion, on uvloop when it is installed."""
+    if uvloop is not None:
+        return uvloop.run(coro)
+    return asyncio.run(coro)
+
 
 # Create Typer app
 app = typer.Typer(
@@ -40,16 +84,16 @@ def run(
     """Run the ETL pipeline."""
     address_list = None
     if addresses:
-        address_list = [addr.strip() for addr in addresses.split(",")]
+        address_list = [addr for addr in map(str.strip, addresses.split(",")) if addr]
 
     if full:
-        asyncio.run(run_full_pipeline(address_list))
+        _run(run_full_pipeline(address_list))
     elif extract_only:
-        asyncio.run(run_extraction())
+        _run(run_extraction())
     elif transform_only:
-        asyncio.run(run_transformation())
+        _run(run_transformation())
     elif load_only:
-        asyncio.run(run_loading())
+        _run(run_loading())
     else:
         console.print(
             "[yellow]Please specify a mode: --full, --extract-only, --transform-only, or --load-only"
@@ -63,7 +107,7 @@ def download(
     limit: int = typer.Option(10000, help="Maximum transactions to download"),
 ) -> None:
     """Download blockchain data."""
-    asyncio.run(download_blockchain_data(address, limit))
+    _run(download_blockchain_data(address, limit))
 
 
 @app.command()
@@ -73,7 +117,7 @@ def extract(
     ),
 ) -> None:
     """Extract data from blockchain."""
-    asyncio.run(run_extraction(output_dir))
+    _run(run_extraction(output_dir))
 
 
 @app.command()
@@ -86,7 +130,7 @@ def transform(
     ),
 ) -> None:
     """Transform extracted data."""
-    asyncio.run(run_transformation(input_dir, output_dir))
+    _run(run_transformation(input_dir, output_dir))
 
 
 @app.command()
@@ -96,20 +140,20 @@ def load(
     ),
 ) -> None:
     """Load transformed data to database."""
-    asyncio.run(run_loading(input_dir))
+    _run(run_loading(input_dir))
 
 
 # Database management commands
 @app.command()
 def init_db() -> None:
     """Initialize database with schemas and tables."""
-    asyncio.run(initialize_database())
+    _run(initialize_database())
 
 
 @app.command()
 def check_db() -> None:
     """Check database connection and show table counts."""
-    asyncio.run(check_database())
+    _run(check_database())
 
 
 @app.command()
@@ -117,51 +161,47 @@ def drop_db() -> None:
     """Drop all database tables (use with caution!)."""
     confirm = typer.confirm("Are you sure you want to drop all database tables?")
     if confirm:
-        asyncio.run(drop_database())
+        _run(drop_database())
     else:
         console.print("[yellow]Operation cancelled.")
 
 
 @app.command()
-def status() -> None:
+def status(
+    exact: bool = typer.Option(
+        False, "--exact", help="Count rows exactly instead of using table statistics"
+    ),
+) -> None:
     """Show ETL pipeline status and statistics."""
-    asyncio.run(show_status())
+    _run(show_status(exact))
 
 
 async def run_full_pipeline(addresses: Optional[list] = None) -> None:
     """Run the complete ETL pipeline."""
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        console=console,
-    ) as progress:
-        task = progress.add_task("Running ETL pipeline...", total=None)
-
-        async with PuzzleSwapETL() as etl:
-            summary = await etl.run_pipeline(addresses=addresses)
-
-            # Display summary
-            console.print("\n[bold green]Pipeline Summary:[/bold green]")
-            console.print(f"Addresses processed: {summary['addresses_processed']}")
-            console.print(
-                f"Transactions extracted: {summary['transactions_extracted']}"
-            )
-            console.print(f"Swaps processed: {summary['swaps_processed']}")
-            console.print(
-                f"Staking events processed: {summary['staking_events_processed']}"
-            )
-            console.print(f"Duration: {summary['duration']:.2f} seconds")
+    from puzzle_swap_etl.pipeline import PuzzleSwapETL
 
-            if summary["errors"]:
-                console.print(
-                    f"\n[red]Errors encountered: {len(summary['errors'])}[/red]"
-                )
-                for error in summary["errors"]:
-                    console.print(f"  - {error}")
+    progress = _get_progress()
+    task = progress.add_task("Running ETL pipeline...", total=None)
 
-        progress.update(
-            task, description="[bold green]Pipeline completed successfully!"
+    async with PuzzleSwapETL() as etl:
+        summary = await etl.run_pipeline(addresses=addresses)
+
+        # Display summary
+        console.print("\n[bold green]Pipeline Summary:[/bold green]")
+        console.print(f"Addresses processed: {summary['addresses_processed']}")
+        console.print(f"Transactions extracted: {summary['transactions_extracted']}")
+        console.print(f"Swaps processed: {summary['swaps_processed']}")
+        console.print(
+            f"Staking events processed: {summary['staking_events_processed']}"
         )
+        console.print(f"Duration: {summary['duration']:.2f} seconds")
+
+        if summary["errors"]:
+            console.print(f"\n[red]Errors encountered: {len(summary['errors'])}[/red]")
+            for error in summary["errors"]:
+                console.print(f"  - {error}")
+
+    progress.update(task, description="[bold green]Pipeline completed successfully!")
 
 
 async def run_extraction(output_dir: str = "data/extracted") -> None:
@@ -170,276 +210,367 @@ async def run_extraction(output_dir: str = "data/extracted") -> None:
 
     Path(output_dir).mkdir(parents=True, exist_ok=True)
 
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        console=console,
-    ) as progress:
-        task = progress.add_task("Extracting blockchain data...", total=None)
-
-        async with BlockchainExtractor() as extractor:
-            # Extract from main addresses
-            from puzzle_swap_etl.mappings import ALL_IMPORTANT_ADDRESSES
+    progress = _get_progress()
+    task = progress.add_task("Extracting blockchain data...", total=None)
+    semaphore = asyncio.Semaphore(settings.worker_threads)
 
-            addresses = ALL_IMPORTANT_ADDRESSES[:5]  # Limit for testing
+    async with BlockchainExtractor() as extractor:
 
-            for address in addresses:
+        async def extract_address(address: str) -> None:
+            async with semaphore:
                 progress.update(task, description=f"Extracting from {address}...")
                 transactions, file_count = await extractor.fetch_all_transactions(
                     address
                 )
 
-                # Save extracted data
-                import json
+                # Save extracted data, one transaction per line; encoding,
+                # compression and the write all run off the event loop
+                filename = f"{output_dir}/{address}_transactions{NDJSON_SUFFIX}"
+                await asyncio.to_thread(write_ndjson, Path(filename), transactions)
 
-                import aiofiles
+                console.print(f"Saved {len(transactions)} transactions to {filename}")
 
-                filename = f"{output_dir}/{address}_transactions.json"
-                async with aiofiles.open(filename, "w") as f:
-                    await f.write(json.dumps(transactions, default=str))
+        # Extract from main addresses
+        from puzzle_swap_etl.mappings import ALL_IMPORTANT_ADDRESSES
 
-                console.print(f"Saved {len(transactions)} transactions to {filename}")
+        addresses = ALL_IMPORTANT_ADDRESSES[:5]  # Limit for testing
+
+        await asyncio.gather(*(extract_address(address) for address in addresses))
 
-        progress.update(task, description="[bold green]Extraction completed!")
+    progress.update(task, description="[bold green]Extraction completed!")
 
 
 async def run_transformation(
     input_dir: str = "data/extracted", output_dir: str = "data/transformed"
 ) -> None:
     """Run transformation phase."""
+    import aiofiles
+
     from puzzle_swap_etl.transformers import StakingTransformer, SwapTransformer
 
-    Path(output_dir).mkdir(parents=True, exist_ok=True)
+    output_path = Path(output_dir)
+    output_path.mkdir(parents=True, exist_ok=True)
 
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        console=console,
-    ) as progress:
-        task = progress.add_task("Transforming data...", total=None)
+    progress = _get_progress()
+    task = progress.add_task("Transforming data...", total=None)
+    semaphore = asyncio.Semaphore(settings.worker_threads)
 
-        swap_transformer = SwapTransformer()
-        staking_transformer = StakingTransformer()
+    swap_transformer = SwapTransformer()
+    staking_transformer = StakingTransformer()
 
-        # Process extracted files
-        import json
-        from pathlib import Path
+    async def transform_file(file_path: Path) -> None:
+        async with semaphore:
+            progress.update(task, description=f"Processing {file_path.name}...")
 
-        import aiofiles
+            stem = file_path.name[: -len(NDJSON_SUFFIX)]
+            swap_file = output_path / f"{stem}_swaps{NDJSON_SUFFIX}"
+            events_file = output_path / f"{stem}_staking{NDJSON_SUFFIX}"
+            swap_count = 0
+            event_count = 0
+
+            # Each stream needs its own compressor context
+            swaps_zstd = zstandard.ZstdCompressor(level=ZSTD_LEVEL).compressobj()
+            events_zstd = zstandard.ZstdCompressor(level=ZSTD_LEVEL).compressobj()
+
+            async with aiofiles.open(swap_file, "wb") as swaps_out:
+                async with aiofiles.open(events_file, "wb") as events_out:
+                    async for batch in read_ndjson_batches(
+                        file_path, settings.batch_size
+                    ):
+                        transactions = _to_waves_transactions(batch)
+
+                        # Transform swaps
+                        swaps = swap_transformer.transform_transactions(transactions)
+                        if swaps:
+                            await swaps_out.write(
+                                swaps_zstd.compress(_dump_models_ndjson(swaps))
+                            )
+                            swap_count += len(swaps)
+
+                        # Transform staking events
+                        events = staking_transformer.transform_transactions(
+                            transactions
+                        )
+                        if events:
+                            await events_out.write(
+                                events_zstd.compress(_dump_models_ndjson(events))
+                            )
+                            event_count += len(events)
+
+                    await swaps_out.write(swaps_zstd.flush())
+                    await events_out.write(events_zstd.flush())
+
+            if swap_count:
+                console.print(f"Saved {swap_count} swaps to {swap_file}")
+            else:
+                swap_file.unlink()
 
-        input_path = Path(input_dir)
-        for file_path in input_path.glob("*_transactions.json"):
-            progress.update(task, description=f"Processing {file_path.name}...")
+            if event_count:
+                console.print(f"Saved {event_count} staking events to {events_file}")
+            else:
+                events_file.unlink()
+
+    # Process extracted files
+    await asyncio.gather(
+        *(
+            transform_file(file_path)
+            for file_path in _list_files(input_dir, f"_transactions{NDJSON_SUFFIX}")
+        )
+    )
 
-            async with aiofiles.open(file_path, "r") as f:
-                content = await f.read()
-                transactions = json.loads(content)
-
-            # Transform swaps
-            swaps = swap_transformer.transform_transactions(transactions)
-            if swaps:
-                swap_file = f"{output_dir}/{file_path.stem}_swaps.json"
-                async with aiofiles.open(swap_file, "w") as f:
-                    await f.write(
-                        json.dumps([swap.dict() for swap in swaps], default=str)
-                    )
-                console.print(f"Saved {len(swaps)} swaps to {swap_file}")
-
-            # Transform staking events
-            events = staking_transformer.transform_transactions(transactions)
-            if events:
-                events_file = f"{output_dir}/{file_path.stem}_staking.json"
-                async with aiofiles.open(events_file, "w") as f:
-                    await f.write(
-                        json.dumps([event.dict() for event in events], default=str)
-                    )
-                console.print(f"Saved {len(events)} staking events to {events_file}")
-
-        progress.update(task, description="[bold green]Transformation completed!")
+    progress.update(task, description="[bold green]Transformation completed!")
 
 
 async def run_loading(input_dir: str = "data/transformed") -> None:
     """Run loading phase."""
     from puzzle_swap_etl.loaders.database import DatabaseLoader
+    from puzzle_swap_etl.models import StakingEventData, SwapData
 
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        console=console,
-    ) as progress:
-        task = progress.add_task("Loading data to database...", total=None)
+    progress = _get_progress()
+    task = progress.add_task("Loading data to database...", total=None)
+    semaphore = asyncio.Semaphore(settings.worker_threads)
 
-        loader = DatabaseLoader()
+    loader = DatabaseLoader()
 
-        # Process transformed files
-        import json
-        from pathlib import Path
+    async def load_swaps_file(file_path: Path) -> None:
+        async with semaphore:
+            progress.update(task, description=f"Loading {file_path.name}...")
 
-        import aiofiles
+            swap_count = 0
+            async with get_db_manager().get_connection() as conn:
+                async for swaps in read_ndjson_batches(
+                    file_path,
+                    settings.batch_size,
+                    decode=SwapData.model_validate_json,
+                ):
+                    await loader.save_swaps(swaps, conn=conn)
+                    swap_count += len(swaps)
 
-        input_path = Path(input_dir)
+            console.print(f"Loaded {swap_count} swaps from {file_path.name}")
 
-        # Load swaps
-        for file_path in input_path.glob("*_swaps.json"):
+    async def load_staking_file(file_path: Path) -> None:
+        async with semaphore:
             progress.update(task, description=f"Loading {file_path.name}...")
 
-            async with aiofiles.open(file_path, "r") as f:
-                content = await f.read()
-                swaps_data = json.loads(content)
+            event_count = 0
+            async with get_db_manager().get_connection() as conn:
+                async for events in read_ndjson_batches(
+                    file_path,
+                    settings.batch_size,
+                    decode=StakingEventData.model_validate_json,
+                ):
+                    await loader.save_staking_events(events, conn=conn)
+                    event_count += len(events)
+
+            console.print(f"Loaded {event_count} staking events from {file_path.name}")
+
+    # Process transformed files in a single directory scan
+    swap_files = []
+    staking_files = []
+    for file_path in _list_files(input_dir, NDJSON_SUFFIX):
+        if file_path.name.endswith(f"_swaps{NDJSON_SUFFIX}"):
+            swap_files.append(file_path)
+        elif file_path.name.endswith(f"_staking{NDJSON_SUFFIX}"):
+            staking_files.append(file_path)
+
+    await asyncio.gather(
+        *(load_swaps_file(fp) for fp in swap_files),
+        *(load_staking_file(fp) for fp in staking_files),
+    )
+
+    progress.update(task, description="[bold green]Loading completed!")
+
+
+def _list_files(directory: str, suffix: str) -> List[Path]:
+    """List regular files in a directory whose names end with a suffix.
+
+    Uses ``os.scandir`` so file type checks come from the cached directory
+    entry instead of an extra ``stat()`` per file.
+
+    Args:
+        directory: Directory to scan
+        suffix: Required file name suffix
+
+    Returns:
+        Matching file paths, sorted by name
+    """
+    with os.scandir(directory) as entries:
+        return sorted(
+            Path(entry.path)
+            for entry in entries
+            if entry.name.endswith(suffix) and entry.is_file()
+        )
 
-            # Convert to SwapData objects
-            from puzzle_swap_etl.models import SwapData
 
-            swaps = [SwapData(**swap) for swap in swaps_data]
+def _dump_models_ndjson(models: Iterable[BaseModel]) -> bytes:
+    """Serialize pydantic models as newline-delimited JSON.
 
-            await loader.save_swaps(swaps)
-            console.print(f"Loaded {len(swaps)} swaps from {file_path.name}")
+    Models are encoded by pydantic's own serializer straight to bytes,
+    without building an intermediate dict or str per record.
 
-        # Load staking events
-        for file_path in input_path.glob("*_staking.json"):
-            progress.update(task, description=f"Loading {file_path.name}...")
+    Args:
+        models: Pydantic model instances
+
+    Returns:
+        Encoded NDJSON chunk, one model per line
+    """
+    return b"".join(
+        model.__pydantic_serializer__.to_json(model) + b"\n" for model in models
+    )
+
+
+def _to_waves_transactions(records: List[Dict[str, Any]]) -> List[Any]:
+    """Wrap extracted raw transactions into WavesTransaction models.
 
-            async with aiofiles.open(file_path, "r") as f:
-                content = await f.read()
-                events_data = json.loads(content)
+    Records that cannot be parsed are logged and skipped.
 
-            # Convert to StakingEventData objects
-            from puzzle_swap_etl.models import StakingEventData
+    Args:
+        records: Raw transaction records
 
-            events = [StakingEventData(**event) for event in events_data]
+    Returns:
+        List of WavesTransaction objects carrying the raw data
+    """
+    from puzzle_swap_etl.models import WavesTransaction
 
-            await loader.save_staking_events(events)
-            console.print(f"Loaded {len(events)} staking events from {file_path.name}")
+    transactions = []
+    for tx in records:
+        try:
+            transactions.append(
+                WavesTransaction(
+                    id=tx["id"],
+                    height=tx["height"],
+                    timestamp=tx["timestamp"],
+                    sender=tx["sender"],
+                    type=tx["type"],
+                    fee=tx.get("fee"),
+                    application_status=tx.get("applicationStatus"),
+                    raw_data=tx,
+                )
+            )
+        except Exception as e:
+            # Skip the malformed record rather than the whole file
+            logger.warning(
+                f"Failed to parse transaction {tx.get('id', 'unknown')}: {e}"
+            )
 
-        progress.update(task, description="[bold green]Loading completed!")
+    return transactions
 
 
 async def download_blockchain_data(address: Optional[str], limit: int) -> None:
     """Download blockchain data for analysis."""
     from puzzle_swap_etl.extractors import BlockchainExtractor
 
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        console=console,
-    ) as progress:
-        task = progress.add_task("Downloading blockchain data...", total=None)
+    progress = _get_progress()
+    task = progress.add_task("Downloading blockchain data...", total=None)
 
-        async with BlockchainExtractor() as extractor:
-            if address:
-                addresses = [address]
-            else:
-                # Use default important addresses
-                from puzzle_swap_etl.mappings import STAKING_ADDRESSES
+    semaphore = asyncio.Semaphore(settings.worker_threads)
+
+    async with BlockchainExtractor() as extractor:
+        if address:
+            addresses = [address]
+        else:
+            # Use default important addresses
+            from puzzle_swap_etl.mappings import STAKING_ADDRESSES
 
-                addresses = STAKING_ADDRESSES[:3]  # Limit for testing
+            addresses = STAKING_ADDRESSES[:3]  # Limit for testing
 
-            for addr in addresses:
+        async def download_address(addr: str) -> None:
+            async with semaphore:
                 progress.update(task, description=f"Downloading from {addr}...")
                 transactions, file_count = await extractor.fetch_all_transactions(addr)
                 console.print(
                     f"Downloaded {len(transactions)} transactions from {addr}"
                 )
 
-        progress.update(task, description="[bold green]Download completed!")
+        await asyncio.gather(*(download_address(addr) for addr in addresses))
+
+    progress.update(task, description="[bold green]Download completed!")
 
 
 async def initialize_database() -> None:
     """Initialize database with schemas and tables."""
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        console=console,
-    ) as progress:
-        task = progress.add_task("Initializing database...", total=None)
+    progress = _get_progress()
+    task = progress.add_task("Initializing database...", total=None)
 
-        try:
-            # Check connection first
-            if not await db_manager.check_connection():
-                console.print("[red]Failed to connect to database!")
-                raise typer.Exit(1)
+    try:
+        # Check connection first
+        if not await get_db_manager().check_connection():
+            console.print("[red]Failed to connect to database!")
+            raise typer.Exit(1)
 
-            # Create schemas and tables
-            await db_manager.create_tables()
+        # Create schemas and tables
+        await get_db_manager().create_tables()
 
-            progress.update(
-                task, description="[bold green]Database initialized successfully!"
-            )
-            console.print(
-                "\n[green]Database schemas and tables created successfully![/green]"
-            )
-            console.print("Schemas created: stg, ods, dm")
+        progress.update(
+            task, description="[bold green]Database initialized successfully!"
+        )
+        console.print(
+            "\n[green]Database schemas and tables created successfully![/green]"
+        )
+        console.print("Schemas created: stg, ods, dm")
 
-        except Exception as e:
-            console.print(f"[red]Failed to initialize database: {str(e)}[/red]")
-            raise typer.Exit(1)
+    except Exception as e:
+        console.print(f"[red]Failed to initialize database: {str(e)}[/red]")
+        raise typer.Exit(1)
 
 
 async def check_database() -> None:
     """Check database connection and show table counts."""
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        console=console,
-    ) as progress:
-        task = progress.add_task("Checking database...", total=None)
+    progress = _get_progress()
+    task = progress.add_task("Checking database...", total=None)
 
-        try:
-            # Check connection
-            if not await db_manager.check_connection():
-                console.print("[red]Failed to connect to database!")
-                raise typer.Exit(1)
+    try:
+        # Check connection
+        if not await get_db_manager().check_connection():
+            console.print("[red]Failed to connect to database!")
+            raise typer.Exit(1)
 
-            # Get table counts
-            counts = await db_manager.get_table_counts()
+        # Get table counts
+        counts = await get_db_manager().get_table_counts()
 
-            progress.update(task, description="[bold green]Database check completed!")
+        progress.update(task, description="[bold green]Database check completed!")
 
-            # Display results in a table
-            table = Table(title="Database Table Counts")
-            table.add_column("Schema.Table", style="cyan")
-            table.add_column("Row Count", style="magenta")
+        # Display results in a table
+        table = Table(title="Database Table Counts")
+        table.add_column("Schema.Table", style="cyan")
+        table.add_column("Row Count", style="magenta")
 
-            for table_name, count in counts.items():
-                table.add_row(table_name, str(count))
+        for table_name, count in counts.items():
+            table.add_row(table_name, str(count))
 
-            console.print(table)
+        console.print(table)
 
-        except Exception as e:
-            console.print(f"[red]Database check failed: {str(e)}[/red]")
-            raise typer.Exit(1)
+    except Exception as e:
+        console.print(f"[red]Database check failed: {str(e)}[/red]")
+        raise typer.Exit(1)
 
 
 async def drop_database() -> None:
     """Drop all database tables."""
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        console=console,
-    ) as progress:
-        task = progress.add_task("Dropping database tables...", total=None)
+    progress = _get_progress()
+    task = progress.add_task("Dropping database tables...", total=None)
 
-        try:
-            await db_manager.drop_tables()
+    try:
+        await get_db_manager().drop_tables()
 
-            progress.update(task, description="[bold green]Database tables dropped!")
-            console.print("\n[yellow]All database tables have been dropped.[/yellow]")
+        progress.update(task, description="[bold green]Database tables dropped!")
+        console.print("\n[yellow]All database tables have been dropped.[/yellow]")
 
-        except Exception as e:
-            console.print(f"[red]Failed to drop database tables: {str(e)}[/red]")
-            raise typer.Exit(1)
+    except Exception as e:
+        console.print(f"[red]Failed to drop database tables: {str(e)}[/red]")
+        raise typer.Exit(1)
 
 
-async def show_status() -> None:
+async def show_status(exact: bool = False) -> None:
     """Show ETL pipeline status and statistics."""
     try:
         # Check database connection
-        if not await db_manager.check_connection():
+        if not await get_db_manager().check_connection():
             console.print("[red]Database connection failed![/red]")
             return
 
         # Get table counts
-        counts = await db_manager.get_table_counts()
+        counts = await get_db_manager().get_table_counts(approximate=not exact)
 
         # Create status table
         table = Table(title="Puzzle Swap ETL Status")
@@ -455,15 +586,12 @@ async def show_status() -> None:
         )
 
         # Schema status
-        stg_tables = sum(
-            1 for k in counts.keys() if k.startswith("stg.") and counts[k] != "Error"
-        )
-        ods_tables = sum(
-            1 for k in counts.keys() if k.startswith("ods.") and counts[k] != "Error"
-        )
-        dm_tables = sum(
-            1 for k in counts.keys() if k.startswith("dm.") and counts[k] != "Error"
+        schema_tables = Counter(
+            name.split(".", 1)[0] for name, count in counts.items() if count != "Error"
         )
+        stg_tables = schema_tables["stg"]
+        ods_tables = schema_tables["ods"]
+        dm_tables = schema_tables["dm"]
 
         table.add_row(
             "STG Schema",
@@ -1,10 +1,13 @@
 """Database package for Puzzle Swap ETL."""
 
-from .connection import DatabaseManager, db_manager
+# The legacy ``db_manager`` attribute is resolved lazily by connection's
+# module ``__getattr__``, which the package re-exports
+from .connection import DatabaseManager, __getattr__, get_db_manager
 from .models import Base
 
 __all__ = [
     "Base",
     "DatabaseManager",
     "db_manager",
+    "get_db_manager",
 ]
@@ -1,15 +1,70 @@
 """Database connection and session management."""
 
+import asyncio
+import time
 from contextlib import asynccontextmanager
-from typing import AsyncGenerator
+from typing import Any, AsyncGenerator, Optional, Tuple, Union
 
-from sqlalchemy import text
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
-from sqlalchemy.pool import NullPool
+from sqlalchemy import Connection, TextClause, text
+from sqlalchemy.ext.asyncio import (
+    AsyncConnection,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 
 from puzzle_swap_etl.config import settings
+from puzzle_swap_etl.database.models_dm import DmBase
+from puzzle_swap_etl.database.models_ods import OdsBase
+from puzzle_swap_etl.database.models_stg import StgBase
 from puzzle_swap_etl.utils import LoggerMixin
 
+# Schemas of the 3-layer architecture
+SCHEMAS = ("stg", "ods", "dm")
+
+# Seconds a check_connection result is reused before probing again
+_HEALTH_TTL = 5.0
+
+# Declarative bases of each layer, in dependency order
+_LAYER_BASES = (StgBase, OdsBase, DmBase)
+
+# Tables reported by get_table_counts, with their COUNT statements built once
+_COUNTED_TABLES = [
+    # STG layer
+    ("stg", "transactions"),
+    ("stg", "asset_info"),
+    ("stg", "pool_info"),
+    ("stg", "price_data"),
+    # ODS layer
+    ("ods", "transactions"),
+    ("ods", "swaps"),
+    ("ods", "staking_events"),
+    ("ods", "assets"),
+    ("ods", "pools"),
+    ("ods", "swap_pairs"),
+    ("ods", "asset_prices"),
+    ("ods", "protocol_allocations"),
+    ("ods", "lending_info"),
+]
+_COUNT_QUERIES = {
+    f"{schema}.{table}": text(f"SELECT COUNT(*) FROM {schema}.{table}")
+    for schema, table in _COUNTED_TABLES
+}
+_ALL_COUNTS_QUERY = text(
+    " UNION ALL ".join(
+        f"SELECT '{schema}.{table}' AS name, COUNT(*) AS count FROM {schema}.{table}"
+        for schema, table in _COUNTED_TABLES
+    )
+)
+# Live row estimates kept by the statistics collector; NULL for missing tables
+_APPROXIMATE_COUNTS_QUERY = text(
+    """
+    SELECT name, s.n_live_tup AS count
+    FROM unnest(CAST(:names AS text[])) AS name
+    LEFT JOIN pg_stat_all_tables s ON s.relid = to_regclass(name)
+    """
+).bindparams(names=list(_COUNT_QUERIES))
+
 
 class DatabaseManager(LoggerMixin):
     """Database connection manager with 3-layer architecture support."""
@@ -18,125 +73,216 @@ class DatabaseManager(LoggerMixin):
         """Initialize database manager."""
         self.engine = create_async_engine(
             settings.database_url,
-            poolclass=NullPool,
+            pool_size=settings.db_pool_size,
+            max_overflow=settings.db_max_overflow,
+            pool_pre_ping=True,
+            pool_recycle=1800,
+            query_cache_size=1200,
             echo=settings.debug,
+            connect_args={
+                "server_settings": {
+                    # Short ETL statements pay JIT compile time without
+                    # running long enough to benefit from it
+                    "jit": "off",
+                    "application_name": "puzzle_swap_etl",
+                },
+            },
         )
         self.session_factory = async_sessionmaker(
             bind=self.engine,
             class_=AsyncSession,
             expire_on_commit=False,
         )
+        # Bounds in-flight sessions and connections to what the pool can
+        # hand out, so concurrent callers queue here instead of timing out
+        # inside the pool. Created per event loop on first use, since the
+        # shared manager can outlive the loop that first used it.
+        self._db_sem: Optional[asyncio.Semaphore] = None
+        self._db_sem_loop: Optional[asyncio.AbstractEventLoop] = None
+        # Monotonic time and result of the last connection check
+        self._last_health: Optional[Tuple[float, bool]] = None
+
+    def _semaphore(self) -> asyncio.Semaphore:
+        """Get the connection-bounding semaphore of the running event loop."""
+        loop = asyncio.get_running_loop()
+        if self._db_sem is None or self._db_sem_loop is not loop:
+            self._db_sem = asyncio.Semaphore(
+                settings.db_pool_size + settings.db_max_overflow
+            )
+            self._db_sem_loop = loop
+        return self._db_sem
 
     @asynccontextmanager
     async def get_session(self) -> AsyncGenerator[AsyncSession, None]:
         """Get database session as async context manager.
 
+        The session is closed on exit, which also rolls back any
+        transaction left uncommitted, including after an exception.
+
         Yields:
             AsyncSession: Database session
         """
-        async with self.session_factory() as session:
-            try:
+        async with self._semaphore():
+            async with self.session_factory() as session:
                 yield session
-            except Exception:
-                await session.rollback()
-                raise
-            finally:
-                await session.close()
+
+    @asynccontextmanager
+    async def get_connection(self) -> AsyncGenerator[AsyncConnection, None]:
+        """Get a Core connection as async context manager.
+
+        Meant for raw SQL that maps no ORM objects, skipping the session's
+        unit-of-work and identity-map bookkeeping. Changes must be
+        committed explicitly.
+
+        Yields:
+            AsyncConnection: Database connection
+        """
+        async with self._semaphore():
+            async with self.engine.connect() as conn:
+                yield conn
+
+    async def execute_script(self, script: str) -> None:
+        """Execute a multi-statement SQL script in a single round trip.
+
+        The script is sent through asyncpg's simple query protocol, since a
+        prepared statement cannot contain several commands. All statements
+        run in one implicit transaction.
+
+        Args:
+            script: Semicolon-separated SQL statements without parameters
+        """
+        async with self.get_connection() as conn:
+            raw_connection = await conn.get_raw_connection()
+            await raw_connection.driver_connection.execute(script)
 
     async def create_schemas(self) -> None:
-        """Create database schemas for 3-layer architecture."""
-        schemas = ["stg", "ods", "dm"]
+        """Create database schemas for 3-layer architecture.
 
-        async with self.get_session() as session:
-            for schema in schemas:
-                try:
-                    await session.execute(text(f"CREATE SCHEMA IF NOT EXISTS {schema}"))
-                    self.logger.info(f"Schema '{schema}' created or already exists")
-                except Exception as e:
-                    self.logger.error(f"Failed to create schema '{schema}': {str(e)}")
-                    raise
+        Schemas are created and granted to the configured database user in
+        a single round trip.
+        """
+        statements = [f"CREATE SCHEMA IF NOT EXISTS {schema}" for schema in SCHEMAS]
+        statements += [
+            f"GRANT ALL PRIVILEGES ON SCHEMA {schema} TO {settings.database_user}"
+            for schema in SCHEMAS
+        ]
 
-            await session.commit()
-            self.logger.info("All schemas created successfully")
+        try:
+            await self.execute_script("; ".join(statements))
+        except Exception as e:
+            self.logger.error(f"Failed to create schemas: {str(e)}")
+            raise
+
+        self.logger.info("All schemas created successfully")
 
     async def create_tables(self) -> None:
         """Create all database tables."""
-        from puzzle_swap_etl.database.models_dm import DmBase
-        from puzzle_swap_etl.database.models_ods import OdsBase
-        from puzzle_swap_etl.database.models_stg import StgBase
-
         # First create schemas
         await self.create_schemas()
 
-        # Then create tables for each layer
-        async with self.engine.begin() as conn:
-            await conn.run_sync(StgBase.metadata.create_all)
-            await conn.run_sync(OdsBase.metadata.create_all)
-            await conn.run_sync(DmBase.metadata.create_all)
+        # Then create tables for each layer in one transaction and one
+        # round trip into the sync DDL runner
+        def create_all(sync_conn: Connection) -> None:
+            for base in _LAYER_BASES:
+                base.metadata.create_all(sync_conn, checkfirst=True)
+
+        async with self.get_connection() as conn, conn.begin():
+            await conn.run_sync(create_all)
 
         self.logger.info("Database tables created successfully")
 
     async def drop_tables(self) -> None:
         """Drop all database tables."""
-        from puzzle_swap_etl.database.models_dm import DmBase
-        from puzzle_swap_etl.database.models_ods import OdsBase
-        from puzzle_swap_etl.database.models_stg import StgBase
 
-        async with self.engine.begin() as conn:
-            await conn.run_sync(DmBase.metadata.drop_all)
-            await conn.run_sync(OdsBase.metadata.drop_all)
-            await conn.run_sync(StgBase.metadata.drop_all)
+        def drop_all(sync_conn: Connection) -> None:
+            for base in reversed(_LAYER_BASES):
+                base.metadata.drop_all(sync_conn)
+
+        async with self.get_connection() as conn, conn.begin():
+            await conn.run_sync(drop_all)
 
         self.logger.info("Database tables dropped successfully")
 
     async def check_connection(self) -> bool:
-        """Check database connection."""
+        """Check database connection.
+
+        The result is reused for a few seconds, so frequent polling, e.g. by
+        liveness probes, does not issue a query on every call.
+        """
+        now = time.monotonic()
+        if self._last_health is not None and now - self._last_health[0] < _HEALTH_TTL:
+            return self._last_health[1]
+
         try:
-            async with self.get_session() as session:
-                await session.execute(text("SELECT 1"))
-                self.logger.info("Database connection successful")
-                return True
+            async with self.get_connection() as conn:
+                await conn.exec_driver_sql("SELECT 1")
+            self.logger.info("Database connection successful")
+            healthy = True
         except Exception as e:
             self.logger.error(f"Database connection failed: {str(e)}")
-            return False
-
-    async def get_table_counts(self) -> dict:
-        """Get row counts for all tables."""
-        counts = {}
-
-        tables = [
-            # STG layer
-            ("stg", "transactions"),
-            ("stg", "asset_info"),
-            ("stg", "pool_info"),
-            ("stg", "price_data"),
-            # ODS layer
-            ("ods", "transactions"),
-            ("ods", "swaps"),
-            ("ods", "staking_events"),
-            ("ods", "assets"),
-            ("ods", "pools"),
-            ("ods", "swap_pairs"),
-            ("ods", "asset_prices"),
-            ("ods", "protocol_allocations"),
-            ("ods", "lending_info"),
-        ]
+            healthy = False
+
+        self._last_health = (now, healthy)
+        return healthy
+
+    async def get_table_counts(self, approximate: bool = False) -> dict:
+        """Get row counts for all tables.
+
+        All tables are counted in a single round trip. If that fails, e.g.
+        because a table is missing, tables are counted one by one so the
+        remaining counts are still reported.
+
+        Args:
+            approximate: Read the statistics collector's live row estimates
+                instead of scanning every table. Cheap regardless of table
+                size, but may lag behind recent writes.
+        """
+        if approximate:
+            return await self._get_approximate_table_counts()
+
+        try:
+            async with self.get_connection() as conn:
+                result = await conn.execute(_ALL_COUNTS_QUERY)
+                counts = dict(result.tuples().all())
+            return {name: counts[name] for name in _COUNT_QUERIES}
+        except Exception as e:
+            self.logger.warning(f"Failed to count all tables at once: {e}")
+
+        return await self._get_table_counts_individually()
+
+    async def _get_approximate_table_counts(self) -> dict:
+        """Get estimated row counts from table statistics.
 
-        async with self.get_session() as session:
-            for schema, table in tables:
-                try:
-                    result = await session.execute(
-                        text(f"SELECT COUNT(*) FROM {schema}.{table}")
-                    )
-                    count = result.scalar()
-                    counts[f"{schema}.{table}"] = count
-                except Exception as e:
-                    self.logger.warning(
-                        f"Failed to get count for {schema}.{table}: {e}"
-                    )
-                    counts[f"{schema}.{table}"] = "Error"
-
-        return counts
+        Missing tables are reported as "Error", like failed exact counts.
+        """
+        async with self.get_connection() as conn:
+            result = await conn.execute(_APPROXIMATE_COUNTS_QUERY)
+            counts = dict(result.tuples().all())
+        return {
+            name: "Error" if counts[name] is None else counts[name]
+            for name in _COUNT_QUERIES
+        }
+
+    async def _get_table_counts_individually(self) -> dict:
+        """Get row counts with one concurrent query per table.
+
+        Each count runs on its own connection, so a failing table does not
+        abort the transaction the other counts run in.
+        """
+
+        async def count_table(name: str, query: TextClause) -> Union[int, str]:
+            try:
+                async with self.get_connection() as conn:
+                    result = await conn.execute(query)
+                    return result.scalar()
+            except Exception as e:
+                self.logger.warning(f"Failed to get count for {name}: {e}")
+                return "Error"
+
+        results = await asyncio.gather(
+            *(count_table(name, query) for name, query in _COUNT_QUERIES.items())
+        )
+        return dict(zip(_COUNT_QUERIES, results))
 
     async def close(self) -> None:
         """Close database connections."""
@@ -144,5 +290,24 @@ class DatabaseManager(LoggerMixin):
         self.logger.info("Database connections closed")
 
 
-# Global database manager instance
-db_manager = DatabaseManager()
+# Global database manager instance, created on first use
+_db_manager: Optional[DatabaseManager] = None
+
+
+def get_db_manager() -> DatabaseManager:
+    """Get the global database manager, creating it on first use.
+
+    Returns:
+        DatabaseManager: Shared database manager
+    """
+    global _db_manager
+    if _db_manager is None:
+        _db_manager = DatabaseManager()
+    return _db_manager
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve the legacy ``db_manager`` attribute lazily."""
+    if name == "db_manager":
+        return get_db_manager()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
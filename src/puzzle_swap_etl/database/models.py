@@ -2,11 +2,58 @@
 
 from sqlalchemy.orm import DeclarativeBase
 
-from .models_dm import *  # noqa: F401, F403
-from .models_ods import *  # noqa: F401, F403
-
 # Import all models from layer-specific files
-from .models_stg import *  # noqa: F401, F403
+from .models_dm import (
+    DmAssetMetrics,
+    DmBase,
+    DmKpiSummary,
+    DmPoolMetrics,
+    DmStakingMetricsDaily,
+    DmTraderMetrics,
+    DmTradingMetricsDaily,
+)
+from .models_ods import (
+    OdsAsset,
+    OdsAssetPrice,
+    OdsBase,
+    OdsLendingInfo,
+    OdsPool,
+    OdsProtocolAllocation,
+    OdsStakingEvent,
+    OdsSwap,
+    OdsSwapPair,
+    OdsTransaction,
+)
+from .models_stg import StgAssetInfo, StgBase, StgPoolInfo, StgPriceData, StgTransaction
+
+__all__ = [
+    "Base",
+    # STG layer
+    "StgBase",
+    "StgTransaction",
+    "StgPriceData",
+    "StgAssetInfo",
+    "StgPoolInfo",
+    # ODS layer
+    "OdsBase",
+    "OdsTransaction",
+    "OdsSwap",
+    "OdsStakingEvent",
+    "OdsAsset",
+    "OdsPool",
+    "OdsSwapPair",
+    "OdsAssetPrice",
+    "OdsProtocolAllocation",
+    "OdsLendingInfo",
+    # DM layer
+    "DmBase",
+    "DmTradingMetricsDaily",
+    "DmStakingMetricsDaily",
+    "DmPoolMetrics",
+    "DmTraderMetrics",
+    "DmAssetMetrics",
+    "DmKpiSummary",
+]
 
 
 class Base(DeclarativeBase):
@@ -5,7 +5,17 @@ from datetime import datetime
 from decimal import Decimal
 from typing import Optional
 
-from sqlalchemy import Boolean, Date, DateTime, Index, Integer, Numeric, String, func
+from sqlalchemy import (
+    Boolean,
+    Date,
+    DateTime,
+    Index,
+    Integer,
+    Numeric,
+    SmallInteger,
+    String,
+    func,
+)
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 
 
@@ -15,7 +25,32 @@ class DmBase(DeclarativeBase):
     pass
 
 
-class DmTradingMetricsDaily(DmBase):
+class DmEtlMetadataMixin:
+    """ETL batch and audit timestamp columns shared by all DM models."""
+
+    etl_batch_id: Mapped[str] = mapped_column(String(50), nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now(),
+        nullable=False,
+    )
+
+
+class DmPeriodMixin:
+    """Reporting period columns shared by per-period DM metrics."""
+
+    period_type: Mapped[str] = mapped_column(
+        String(10), nullable=False
+    )  # 'daily', 'weekly', 'monthly', 'all_time'
+    period_start: Mapped[date_type] = mapped_column(Date, nullable=False)
+    period_end: Mapped[date_type] = mapped_column(Date, nullable=False)
+
+
+class DmTradingMetricsDaily(DmEtlMetadataMixin, DmBase):
     """Daily trading metrics aggregation."""
 
     __tablename__ = "trading_metrics_daily"
@@ -47,20 +82,8 @@ class DmTradingMetricsDaily(DmBase):
     top_asset_by_volume_symbol: Mapped[Optional[str]] = mapped_column(String(20))
     top_asset_volume_usd: Mapped[Optional[Decimal]] = mapped_column(Numeric(20, 8))
 
-    # ETL metadata
-    etl_batch_id: Mapped[str] = mapped_column(String(50), nullable=False)
-    created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), server_default=func.now(), nullable=False
-    )
-    updated_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True),
-        server_default=func.now(),
-        onupdate=func.now(),
-        nullable=False,
-    )
 
-
-class DmStakingMetricsDaily(DmBase):
+class DmStakingMetricsDaily(DmEtlMetadataMixin, DmBase):
     """Daily staking metrics aggregation."""
 
     __tablename__ = "staking_metrics_daily"
@@ -102,27 +125,27 @@ class DmStakingMetricsDaily(DmBase):
     )
     net_staking_flow_usd: Mapped[Optional[Decimal]] = mapped_column(Numeric(20, 8))
 
-    # ETL metadata
-    etl_batch_id: Mapped[str] = mapped_column(String(50), nullable=False)
-    created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), server_default=func.now(), nullable=False
-    )
-    updated_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True),
-        server_default=func.now(),
-        onupdate=func.now(),
-        nullable=False,
-    )
-
 
-class DmPoolMetrics(DmBase):
+class DmPoolMetrics(DmPeriodMixin, DmEtlMetadataMixin, DmBase):
     """Pool performance metrics."""
 
     __tablename__ = "pool_metrics"
     __table_args__ = (
-        Index("ix_dm_pool_metrics_pool_address", "pool_address"),
-        Index("ix_dm_pool_metrics_period", "period_type", "period_start", "period_end"),
-        Index("ix_dm_pool_metrics_volume", "total_volume_usd"),
+        # Covers top-N by volume within a period as an index-only scan
+        Index(
+            "ix_dm_pool_metrics_topn",
+            "period_type",
+            "period_start",
+            "total_volume_usd",
+            postgresql_include=[
+                "pool_address",
+                "pool_name",
+                "asset_a_symbol",
+                "asset_b_symbol",
+                "total_swaps",
+                "unique_traders",
+            ],
+        ),
         Index(
             "ix_dm_pool_metrics_unique",
             "pool_address",
@@ -141,13 +164,6 @@ class DmPoolMetrics(DmBase):
     asset_b_symbol: Mapped[str] = mapped_column(String(20), nullable=False)
     pool_name: Mapped[str] = mapped_column(String(100), nullable=False)
 
-    # Time period
-    period_type: Mapped[str] = mapped_column(
-        String(10), nullable=False
-    )  # 'daily', 'weekly', 'monthly'
-    period_start: Mapped[date_type] = mapped_column(Date, nullable=False)
-    period_end: Mapped[date_type] = mapped_column(Date, nullable=False)
-
     # Volume metrics
     total_volume_usd: Mapped[Decimal] = mapped_column(
         Numeric(20, 8), default=0, nullable=False
@@ -165,33 +181,29 @@ class DmPoolMetrics(DmBase):
     avg_swap_size_usd: Mapped[Optional[Decimal]] = mapped_column(Numeric(20, 8))
     largest_swap_usd: Mapped[Optional[Decimal]] = mapped_column(Numeric(20, 8))
 
-    # Rankings
-    volume_rank: Mapped[Optional[int]] = mapped_column(Integer)
-    swap_count_rank: Mapped[Optional[int]] = mapped_column(Integer)
-
-    # ETL metadata
-    etl_batch_id: Mapped[str] = mapped_column(String(50), nullable=False)
-    created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), server_default=func.now(), nullable=False
-    )
-    updated_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True),
-        server_default=func.now(),
-        onupdate=func.now(),
-        nullable=False,
-    )
+    # Rankings (pool counts are far below the SMALLINT range)
+    volume_rank: Mapped[Optional[int]] = mapped_column(SmallInteger)
+    swap_count_rank: Mapped[Optional[int]] = mapped_column(SmallInteger)
 
 
-class DmTraderMetrics(DmBase):
+class DmTraderMetrics(DmPeriodMixin, DmEtlMetadataMixin, DmBase):
     """Trader performance metrics."""
 
     __tablename__ = "trader_metrics"
     __table_args__ = (
-        Index("ix_dm_trader_metrics_trader_address", "trader_address"),
+        # Covers top-N by volume within a period as an index-only scan
         Index(
-            "ix_dm_trader_metrics_period", "period_type", "period_start", "period_end"
+            "ix_dm_trader_metrics_topn",
+            "period_type",
+            "period_start",
+            "total_volume_usd",
+            postgresql_include=[
+                "trader_address",
+                "total_swaps",
+                "trader_tier",
+                "is_whale",
+            ],
         ),
-        Index("ix_dm_trader_metrics_volume", "total_volume_usd"),
         Index(
             "ix_dm_trader_metrics_unique",
             "trader_address",
@@ -205,10 +217,7 @@ class DmTraderMetrics(DmBase):
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     trader_address: Mapped[str] = mapped_column(String(35), nullable=False)
 
-    # Time period
-    period_type: Mapped[str] = mapped_column(
-        String(10), nullable=False
-    )  # 'daily', 'weekly', 'monthly', 'all_time'
+    # Time period ('all_time' rows have no bounds)
     period_start: Mapped[Optional[date_type]] = mapped_column(Date)
     period_end: Mapped[Optional[date_type]] = mapped_column(Date)
 
@@ -244,29 +253,25 @@ class DmTraderMetrics(DmBase):
     )  # bronze, silver, gold, platinum
     is_whale: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
 
-    # ETL metadata
-    etl_batch_id: Mapped[str] = mapped_column(String(50), nullable=False)
-    created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), server_default=func.now(), nullable=False
-    )
-    updated_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True),
-        server_default=func.now(),
-        onupdate=func.now(),
-        nullable=False,
-    )
-
 
-class DmAssetMetrics(DmBase):
+class DmAssetMetrics(DmPeriodMixin, DmEtlMetadataMixin, DmBase):
     """Asset trading metrics."""
 
     __tablename__ = "asset_metrics"
     __table_args__ = (
-        Index("ix_dm_asset_metrics_asset_id", "asset_id"),
+        # Covers top-N by volume within a period as an index-only scan
         Index(
-            "ix_dm_asset_metrics_period", "period_type", "period_start", "period_end"
+            "ix_dm_asset_metrics_topn",
+            "period_type",
+            "period_start",
+            "total_volume_usd",
+            postgresql_include=[
+                "asset_id",
+                "asset_symbol",
+                "total_swaps",
+                "unique_traders",
+            ],
         ),
-        Index("ix_dm_asset_metrics_volume", "total_volume_usd"),
         Index(
             "ix_dm_asset_metrics_unique",
             "asset_id",
@@ -282,13 +287,6 @@ class DmAssetMetrics(DmBase):
     asset_symbol: Mapped[str] = mapped_column(String(20), nullable=False)
     asset_name: Mapped[str] = mapped_column(String(100), nullable=False)
 
-    # Time period
-    period_type: Mapped[str] = mapped_column(
-        String(10), nullable=False
-    )  # 'daily', 'weekly', 'monthly'
-    period_start: Mapped[date_type] = mapped_column(Date, nullable=False)
-    period_end: Mapped[date_type] = mapped_column(Date, nullable=False)
-
     # Trading metrics
     total_volume_usd: Mapped[Decimal] = mapped_column(
         Numeric(20, 8), default=0, nullable=False
@@ -311,24 +309,12 @@ class DmAssetMetrics(DmBase):
         Numeric(20, 8), default=0, nullable=False
     )
 
-    # Rankings
-    volume_rank: Mapped[Optional[int]] = mapped_column(Integer)
-    trader_count_rank: Mapped[Optional[int]] = mapped_column(Integer)
-
-    # ETL metadata
-    etl_batch_id: Mapped[str] = mapped_column(String(50), nullable=False)
-    created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), server_default=func.now(), nullable=False
-    )
-    updated_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True),
-        server_default=func.now(),
-        onupdate=func.now(),
-        nullable=False,
-    )
+    # Rankings (asset counts are far below the SMALLINT range)
+    volume_rank: Mapped[Optional[int]] = mapped_column(SmallInteger)
+    trader_count_rank: Mapped[Optional[int]] = mapped_column(SmallInteger)
 
 
-class DmKpiSummary(DmBase):
+class DmKpiSummary(DmEtlMetadataMixin, DmBase):
     """Key Performance Indicators summary."""
 
     __tablename__ = "kpi_summary"
@@ -371,15 +357,3 @@ class DmKpiSummary(DmBase):
     volume_growth_24h: Mapped[Optional[Decimal]] = mapped_column(Numeric(10, 4))
     trader_growth_24h: Mapped[Optional[Decimal]] = mapped_column(Numeric(10, 4))
     staking_growth_24h: Mapped[Optional[Decimal]] = mapped_column(Numeric(10, 4))
-
-    # ETL metadata
-    etl_batch_id: Mapped[str] = mapped_column(String(50), nullable=False)
-    created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), server_default=func.now(), nullable=False
-    )
-    updated_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True),
-        server_default=func.now(),
-        onupdate=func.now(),
-        nullable=False,
-    )
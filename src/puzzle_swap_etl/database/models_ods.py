@@ -2,20 +2,34 @@
 
 from datetime import datetime
 from decimal import Decimal
-from typing import Optional
+from typing import ClassVar, Optional
 
 from sqlalchemy import (
     BigInteger,
     Boolean,
+    Computed,
     DateTime,
+    Enum,
+    Identity,
     Index,
     Integer,
     Numeric,
     String,
     Text,
     func,
+    text,
+)
+from sqlalchemy.orm import DeclarativeBase, Mapped, declared_attr, mapped_column
+
+# Closed set of staking event types produced by the staking transformer
+STAKING_EVENT_TYPES = (
+    "stake",
+    "unstake",
+    "claim",
+    "compound",
+    "emergency_withdraw",
+    "stake_update",
 )
-from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 
 
 class OdsBase(DeclarativeBase):
@@ -24,16 +38,70 @@ class OdsBase(DeclarativeBase):
     pass
 
 
-class OdsTransaction(OdsBase):
+class OdsTimestampMixin:
+    """Audit timestamp columns shared by mutable ODS models."""
+
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now(),
+        nullable=False,
+    )
+
+
+class OdsEtlMetadataMixin(OdsTimestampMixin):
+    """ETL batch, source and audit timestamp columns of cleaned entities."""
+
+    default_source_system: ClassVar[str] = "waves_blockchain"
+
+    etl_batch_id: Mapped[str] = mapped_column(String(50), nullable=False)
+
+    @declared_attr
+    def source_system(cls) -> Mapped[str]:
+        """Source system column, defaulting to the model's source."""
+        return mapped_column(
+            String(50), default=cls.default_source_system, nullable=False
+        )
+
+
+class OdsValidationMixin:
+    """Data quality flags of cleaned entities."""
+
+    is_valid: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
+    validation_errors: Mapped[Optional[str]] = mapped_column(Text)
+
+
+class OdsTransaction(OdsValidationMixin, OdsEtlMetadataMixin, OdsBase):
     """Cleaned and validated transaction data."""
 
     __tablename__ = "transactions"
     __table_args__ = (
-        Index("ix_ods_transactions_height", "height"),
-        Index("ix_ods_transactions_timestamp", "timestamp"),
+        # Heights and timestamps grow with insert order, so block-range
+        # indexes prune range scans at a fraction of a B-tree's size
+        Index(
+            "ix_ods_transactions_height_brin",
+            "height",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
+        Index(
+            "ix_ods_transactions_timestamp_brin",
+            "timestamp",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
         Index("ix_ods_transactions_sender", "sender"),
         Index("ix_ods_transactions_type", "type"),
-        Index("ix_ods_transactions_is_puzzle_related", "is_puzzle_related"),
+        # Partial index over the Puzzle-related subset instead of a B-tree
+        # on a two-valued flag
+        Index(
+            "ix_ods_transactions_puzzle_related_timestamp",
+            "timestamp",
+            postgresql_where=text("is_puzzle_related"),
+        ),
         Index("ix_ods_transactions_function_name", "function_name"),
         Index("ix_ods_transactions_etl_batch_id", "etl_batch_id"),
         {"schema": "ods"},
@@ -54,38 +122,38 @@ class OdsTransaction(OdsBase):
     function_name: Mapped[Optional[str]] = mapped_column(String(50))
     contract_address: Mapped[Optional[str]] = mapped_column(String(35))
 
-    # Data quality flags
-    is_valid: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
-    validation_errors: Mapped[Optional[str]] = mapped_column(Text)
 
-    # ETL metadata
-    etl_batch_id: Mapped[str] = mapped_column(String(50), nullable=False)
-    source_system: Mapped[str] = mapped_column(
-        String(50), default="waves_blockchain", nullable=False
-    )
-    created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), server_default=func.now(), nullable=False
-    )
-    updated_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True),
-        server_default=func.now(),
-        onupdate=func.now(),
-        nullable=False,
-    )
-
-
-class OdsSwap(OdsBase):
+class OdsSwap(OdsValidationMixin, OdsEtlMetadataMixin, OdsBase):
     """Cleaned and validated swap transaction data."""
 
     __tablename__ = "swaps"
     __table_args__ = (
-        Index("ix_ods_swaps_timestamp", "timestamp"),
-        Index("ix_ods_swaps_pool_address", "pool_address"),
+        # Per-pool volume over time is answered from the index alone
+        Index(
+            "ix_ods_swaps_pool_address_timestamp",
+            "pool_address",
+            "timestamp",
+            postgresql_include=["volume_usd", "amount_in_usd"],
+        ),
         Index("ix_ods_swaps_trader_address", "trader_address"),
         Index("ix_ods_swaps_asset_in_id", "asset_in_id"),
         Index("ix_ods_swaps_asset_out_id", "asset_out_id"),
         Index("ix_ods_swaps_volume_usd", "volume_usd"),
         Index("ix_ods_swaps_etl_batch_id", "etl_batch_id"),
+        # UTC trading day of valid swaps, for the daily DM aggregation
+        Index(
+            "ix_ods_swaps_valid_date",
+            text("((timestamp AT TIME ZONE 'UTC')::date)"),
+            postgresql_where=text("is_valid"),
+        ),
+        # Compact block-range index for time-range scans over the
+        # append-only fact table
+        Index(
+            "ix_ods_swaps_timestamp_brin",
+            "timestamp",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
         {"schema": "ods"},
     )
 
@@ -105,12 +173,12 @@ class OdsSwap(OdsBase):
     # Amounts (normalized to proper decimals)
     amount_in: Mapped[Decimal] = mapped_column(Numeric(30, 8), nullable=False)
     amount_out: Mapped[Decimal] = mapped_column(Numeric(30, 8), nullable=False)
-    amount_in_raw: Mapped[Decimal] = mapped_column(
-        Numeric(30, 0), nullable=False
-    )  # Raw blockchain amount
-    amount_out_raw: Mapped[Decimal] = mapped_column(
-        Numeric(30, 0), nullable=False
-    )  # Raw blockchain amount
+    amount_in_raw: Mapped[int] = mapped_column(
+        BigInteger, nullable=False
+    )  # Raw blockchain amount (Waves amounts are 64-bit integers)
+    amount_out_raw: Mapped[int] = mapped_column(
+        BigInteger, nullable=False
+    )  # Raw blockchain amount (Waves amounts are 64-bit integers)
 
     # USD values
     amount_in_usd: Mapped[Optional[Decimal]] = mapped_column(Numeric(20, 8))
@@ -125,35 +193,42 @@ class OdsSwap(OdsBase):
     price_impact: Mapped[Optional[Decimal]] = mapped_column(Numeric(10, 6))
     exchange_rate: Mapped[Optional[Decimal]] = mapped_column(Numeric(30, 8))
 
-    # Data quality
-    is_valid: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
-    validation_errors: Mapped[Optional[str]] = mapped_column(Text)
-
-    # ETL metadata
-    etl_batch_id: Mapped[str] = mapped_column(String(50), nullable=False)
-    source_system: Mapped[str] = mapped_column(
-        String(50), default="waves_blockchain", nullable=False
-    )
-    created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), server_default=func.now(), nullable=False
-    )
-    updated_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True),
-        server_default=func.now(),
-        onupdate=func.now(),
-        nullable=False,
-    )
-
 
-class OdsStakingEvent(OdsBase):
+class OdsStakingEvent(OdsValidationMixin, OdsEtlMetadataMixin, OdsBase):
     """Cleaned and validated staking events."""
 
     __tablename__ = "staking_events"
     __table_args__ = (
-        Index("ix_ods_staking_events_timestamp", "timestamp"),
-        Index("ix_ods_staking_events_staker_address", "staker_address"),
+        Index(
+            "ix_ods_staking_events_staker_address_timestamp",
+            "staker_address",
+            "timestamp",
+            postgresql_include=["amount", "amount_usd"],
+        ),
         Index("ix_ods_staking_events_event_type", "event_type"),
         Index("ix_ods_staking_events_etl_batch_id", "etl_batch_id"),
+        # UTC staking day of valid events, for the daily DM aggregation
+        Index(
+            "ix_ods_staking_events_valid_date_event_type",
+            text("((timestamp AT TIME ZONE 'UTC')::date)"),
+            "event_type",
+            postgresql_where=text("is_valid"),
+        ),
+        # Windowed distinct-staker counts for the KPI summary
+        Index(
+            "ix_ods_staking_events_valid_timestamp",
+            "timestamp",
+            postgresql_where=text("is_valid"),
+            postgresql_include=["staker_address"],
+        ),
+        # Compact block-range index for time-range scans over the
+        # append-only fact table
+        Index(
+            "ix_ods_staking_events_timestamp_brin",
+            "timestamp",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
         {"schema": "ods"},
     )
 
@@ -163,48 +238,29 @@ class OdsStakingEvent(OdsBase):
     timestamp: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
     staker_address: Mapped[str] = mapped_column(String(35), nullable=False)
     event_type: Mapped[str] = mapped_column(
-        String(20), nullable=False
-    )  # 'stake', 'unstake', 'claim', 'stake_update'
+        Enum(*STAKING_EVENT_TYPES, name="staking_event_type", schema="ods"),
+        nullable=False,
+    )
 
     # Amounts
     amount: Mapped[Decimal] = mapped_column(Numeric(30, 8), nullable=False)
-    amount_raw: Mapped[Decimal] = mapped_column(
-        Numeric(30, 0), nullable=False
-    )  # Raw blockchain amount
+    amount_raw: Mapped[int] = mapped_column(
+        BigInteger, nullable=False
+    )  # Raw blockchain amount (Waves amounts are 64-bit integers)
     amount_usd: Mapped[Optional[Decimal]] = mapped_column(Numeric(20, 8))
 
     # Additional context
     total_staked_after: Mapped[Optional[Decimal]] = mapped_column(Numeric(30, 8))
     reward_amount: Mapped[Optional[Decimal]] = mapped_column(Numeric(30, 8))
 
-    # Data quality
-    is_valid: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
-    validation_errors: Mapped[Optional[str]] = mapped_column(Text)
 
-    # ETL metadata
-    etl_batch_id: Mapped[str] = mapped_column(String(50), nullable=False)
-    source_system: Mapped[str] = mapped_column(
-        String(50), default="waves_blockchain", nullable=False
-    )
-    created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), server_default=func.now(), nullable=False
-    )
-    updated_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True),
-        server_default=func.now(),
-        onupdate=func.now(),
-        nullable=False,
-    )
-
-
-class OdsAsset(OdsBase):
+class OdsAsset(OdsValidationMixin, OdsEtlMetadataMixin, OdsBase):
     """Cleaned and validated asset information."""
 
     __tablename__ = "assets"
     __table_args__ = (
         Index("ix_ods_assets_symbol", "symbol"),
         Index("ix_ods_assets_asset_type", "asset_type"),
-        Index("ix_ods_assets_is_verified", "is_verified"),
         Index("ix_ods_assets_etl_batch_id", "etl_batch_id"),
         {"schema": "ods"},
     )
@@ -224,34 +280,16 @@ class OdsAsset(OdsBase):
     )  # 'token', 'nft', 'stable'
     is_verified: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
 
-    # Data quality
-    is_valid: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
-    validation_errors: Mapped[Optional[str]] = mapped_column(Text)
-
-    # ETL metadata
-    etl_batch_id: Mapped[str] = mapped_column(String(50), nullable=False)
-    source_system: Mapped[str] = mapped_column(
-        String(50), default="waves_blockchain", nullable=False
-    )
-    created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), server_default=func.now(), nullable=False
-    )
-    updated_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True),
-        server_default=func.now(),
-        onupdate=func.now(),
-        nullable=False,
-    )
-
 
-class OdsPool(OdsBase):
+class OdsPool(OdsValidationMixin, OdsEtlMetadataMixin, OdsBase):
     """Cleaned and validated pool information."""
 
     __tablename__ = "pools"
+    # Pools are sourced from the Puzzle API rather than the blockchain
+    default_source_system = "puzzle_api"
     __table_args__ = (
         Index("ix_ods_pools_asset_a_id", "asset_a_id"),
         Index("ix_ods_pools_asset_b_id", "asset_b_id"),
-        Index("ix_ods_pools_active", "active"),
         Index("ix_ods_pools_total_volume_usd", "total_volume_usd"),
         Index("ix_ods_pools_etl_batch_id", "etl_batch_id"),
         {"schema": "ods"},
@@ -272,35 +310,14 @@ class OdsPool(OdsBase):
     )
     total_swaps: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
 
-    # Data quality
-    is_valid: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
-    validation_errors: Mapped[Optional[str]] = mapped_column(Text)
-
-    # ETL metadata
-    etl_batch_id: Mapped[str] = mapped_column(String(50), nullable=False)
-    source_system: Mapped[str] = mapped_column(
-        String(50), default="puzzle_api", nullable=False
-    )
-    created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), server_default=func.now(), nullable=False
-    )
-    updated_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True),
-        server_default=func.now(),
-        onupdate=func.now(),
-        nullable=False,
-    )
-
 
-class OdsSwapPair(OdsBase):
+class OdsSwapPair(OdsTimestampMixin, OdsBase):
     """Aggregated swap pair statistics."""
 
     __tablename__ = "swap_pairs"
     __table_args__ = (
-        Index("ix_ods_swap_pairs_asset_a_id", "asset_a_id"),
         Index("ix_ods_swap_pairs_asset_b_id", "asset_b_id"),
         Index("ix_ods_swap_pairs_total_volume_usd", "total_volume_usd"),
-        Index("ix_ods_swap_pairs_is_active", "is_active"),
         {"schema": "ods"},
     )
 
@@ -308,7 +325,11 @@ class OdsSwapPair(OdsBase):
     asset_b_id: Mapped[str] = mapped_column(String(44), primary_key=True)
     pool_address: Mapped[str] = mapped_column(String(35), primary_key=True)
 
-    pair_name: Mapped[str] = mapped_column(String(50), nullable=False)
+    # Derived from the key, so it is never part of the INSERT payload
+    pair_name: Mapped[str] = mapped_column(
+        String(50),
+        Computed("left(asset_a_id, 8) || '/' || left(asset_b_id, 8)", persisted=True),
+    )
     total_volume_usd: Mapped[Decimal] = mapped_column(
         Numeric(20, 8), default=0, nullable=False
     )
@@ -316,17 +337,6 @@ class OdsSwapPair(OdsBase):
     fee_rate: Mapped[Decimal] = mapped_column(Numeric(10, 8), nullable=False)
     is_active: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
 
-    # ETL metadata
-    created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), server_default=func.now(), nullable=False
-    )
-    updated_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True),
-        server_default=func.now(),
-        onupdate=func.now(),
-        nullable=False,
-    )
-
 
 class OdsAssetPrice(OdsBase):
     """Asset price information."""
@@ -334,12 +344,19 @@ class OdsAssetPrice(OdsBase):
     __tablename__ = "asset_prices"
     __table_args__ = (
         Index("ix_ods_asset_prices_asset_id", "asset_id"),
-        Index("ix_ods_asset_prices_timestamp", "timestamp"),
+        Index(
+            "ix_ods_asset_prices_timestamp_brin",
+            "timestamp",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
         Index("ix_ods_asset_prices_source", "source"),
         {"schema": "ods"},
     )
 
-    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    id: Mapped[int] = mapped_column(
+        BigInteger, Identity(always=False, cache=1000), primary_key=True
+    )
     asset_id: Mapped[str] = mapped_column(String(44), nullable=False)
     timestamp: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
     price_usd: Mapped[Decimal] = mapped_column(Numeric(20, 8), nullable=False)
@@ -363,11 +380,18 @@ class OdsProtocolAllocation(OdsBase):
     __table_args__ = (
         Index("ix_ods_protocol_allocations_protocol_address", "protocol_address"),
         Index("ix_ods_protocol_allocations_asset_id", "asset_id"),
-        Index("ix_ods_protocol_allocations_timestamp", "timestamp"),
+        Index(
+            "ix_ods_protocol_allocations_timestamp_brin",
+            "timestamp",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
         {"schema": "ods"},
     )
 
-    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    id: Mapped[int] = mapped_column(
+        BigInteger, Identity(always=False, cache=1000), primary_key=True
+    )
     protocol_address: Mapped[str] = mapped_column(String(35), nullable=False)
     protocol_name: Mapped[str] = mapped_column(String(100), nullable=False)
     protocol_type: Mapped[str] = mapped_column(String(50), nullable=False)
@@ -393,7 +417,9 @@ class OdsLendingInfo(OdsBase):
         {"schema": "ods"},
     )
 
-    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    id: Mapped[int] = mapped_column(
+        BigInteger, Identity(always=False, cache=1000), primary_key=True
+    )
     protocol_address: Mapped[str] = mapped_column(String(35), nullable=False)
     asset_id: Mapped[str] = mapped_column(String(44), nullable=False)
     total_supplied: Mapped[Decimal] = mapped_column(Numeric(30, 8), nullable=False)
@@ -7,24 +7,40 @@ from sqlalchemy import (
     Boolean,
     Column,
     DateTime,
+    Identity,
     Index,
     Integer,
     Numeric,
     String,
     Text,
     func,
+    text,
 )
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 
 
 class StgBase(DeclarativeBase):
-    """Base class for staging schema models."""
+    """Base class for staging schema models.
+
+    Staging tables are created UNLOGGED: their contents can be re-fetched
+    from the node and APIs, so they skip the WAL at the cost of being
+    truncated after a crash.
+    """
 
     pass
 
 
-class StgTransaction(StgBase):
+class StgEtlMetadataMixin:
+    """ETL batch and load timestamp columns shared by all staging models."""
+
+    etl_batch_id = Column(String(50))
+    etl_loaded_at = Column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
+
+
+class StgTransaction(StgEtlMetadataMixin, StgBase):
     """Raw blockchain transaction data in staging."""
 
     __tablename__ = "transactions"
@@ -33,9 +49,20 @@ class StgTransaction(StgBase):
         Index("ix_stg_transactions_timestamp", "timestamp"),
         Index("ix_stg_transactions_sender", "sender"),
         Index("ix_stg_transactions_type", "type"),
-        Index("ix_stg_transactions_processed", "processed"),
+        # Only the unprocessed backlog is ever looked up by this flag
+        Index(
+            "ix_stg_transactions_unprocessed_height",
+            "height",
+            postgresql_where=text("NOT processed"),
+        ),
         Index("ix_stg_transactions_etl_batch_id", "etl_batch_id"),
-        {"schema": "stg"},
+        # Invoked dApp function, for reprocessing a subset of raw invokes
+        # without unpacking every document
+        Index(
+            "ix_stg_transactions_call_function",
+            text("(raw_data -> 'call' ->> 'function')"),
+        ),
+        {"schema": "stg", "prefixes": ["UNLOGGED"]},
     )
 
     id = Column(String(44), primary_key=True)
@@ -51,14 +78,8 @@ class StgTransaction(StgBase):
         DateTime(timezone=True), server_default=func.now(), nullable=False
     )
 
-    # ETL metadata
-    etl_batch_id = Column(String(50))
-    etl_loaded_at = Column(
-        DateTime(timezone=True), server_default=func.now(), nullable=False
-    )
-
 
-class StgPriceData(StgBase):
+class StgPriceData(StgEtlMetadataMixin, StgBase):
     """Raw price data from external APIs."""
 
     __tablename__ = "price_data"
@@ -66,31 +87,25 @@ class StgPriceData(StgBase):
         Index("ix_stg_price_data_asset_id", "asset_id"),
         Index("ix_stg_price_data_fetched_at", "fetched_at"),
         Index("ix_stg_price_data_source", "source"),
-        {"schema": "stg"},
+        {"schema": "stg", "prefixes": ["UNLOGGED"]},
     )
 
-    id = Column(Integer, primary_key=True, autoincrement=True)
+    id = Column(BigInteger, Identity(always=False, cache=1000), primary_key=True)
     asset_id = Column(String(44), nullable=False)
     price_usd = Column(Numeric(20, 8), nullable=False)
     source = Column(String(50), nullable=False)  # 'aggregator', 'coingecko', etc.
     raw_response = Column(JSONB, nullable=False)
     fetched_at = Column(DateTime(timezone=True), nullable=False)
 
-    # ETL metadata
-    etl_batch_id = Column(String(50))
-    etl_loaded_at = Column(
-        DateTime(timezone=True), server_default=func.now(), nullable=False
-    )
-
 
-class StgAssetInfo(StgBase):
+class StgAssetInfo(StgEtlMetadataMixin, StgBase):
     """Raw asset information from blockchain."""
 
     __tablename__ = "asset_info"
     __table_args__ = (
         Index("ix_stg_asset_info_symbol", "symbol"),
         Index("ix_stg_asset_info_issuer", "issuer"),
-        {"schema": "stg"},
+        {"schema": "stg", "prefixes": ["UNLOGGED"]},
     )
 
     id = Column(String(44), primary_key=True)
@@ -103,21 +118,15 @@ class StgAssetInfo(StgBase):
     reissuable = Column(Boolean)
     raw_data = Column(JSONB, nullable=False)
 
-    # ETL metadata
-    etl_batch_id = Column(String(50))
-    etl_loaded_at = Column(
-        DateTime(timezone=True), server_default=func.now(), nullable=False
-    )
-
 
-class StgPoolInfo(StgBase):
+class StgPoolInfo(StgEtlMetadataMixin, StgBase):
     """Raw pool information from Puzzle Swap API."""
 
     __tablename__ = "pool_info"
     __table_args__ = (
         Index("ix_stg_pool_info_asset_a_id", "asset_a_id"),
         Index("ix_stg_pool_info_asset_b_id", "asset_b_id"),
-        {"schema": "stg"},
+        {"schema": "stg", "prefixes": ["UNLOGGED"]},
     )
 
     address = Column(String(35), primary_key=True)
@@ -127,9 +136,3 @@ class StgPoolInfo(StgBase):
     fee_rate = Column(Numeric(10, 8))
     active = Column(Boolean)
     raw_data = Column(JSONB, nullable=False)
-
-    # ETL metadata
-    etl_batch_id = Column(String(50))
-    etl_loaded_at = Column(
-        DateTime(timezone=True), server_default=func.now(), nullable=False
-    )
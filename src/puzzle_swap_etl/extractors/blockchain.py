@@ -1,13 +1,19 @@
 """Blockchain data extractor for Waves blockchain."""
 
-import json
-from typing import Any, Dict, List, Optional, Tuple
+import asyncio
+from typing import AbstractSet, Any, Dict, List, Optional, Tuple
 
-import aiofiles
+import aiofiles.os
 
 from puzzle_swap_etl.config import settings
 from puzzle_swap_etl.mappings import AddressMapping, FunctionMapping
-from puzzle_swap_etl.utils import HTTPClient, LoggerMixin
+from puzzle_swap_etl.utils import (
+    NDJSON_SUFFIX,
+    HTTPClient,
+    LoggerMixin,
+    load_ndjson,
+    write_ndjson,
+)
 
 
 class BlockchainExtractor(LoggerMixin):
@@ -16,6 +22,10 @@ class BlockchainExtractor(LoggerMixin):
     def __init__(self) -> None:
         """Initialize blockchain extractor."""
         self.http_client: Optional[HTTPClient] = None
+        # Asset details fetched so far, and per-asset locks so concurrent
+        # misses for the same asset share one request
+        self._asset_cache: Dict[str, Dict[str, Any]] = {}
+        self._asset_locks: Dict[str, asyncio.Lock] = {}
 
     async def __aenter__(self) -> "BlockchainExtractor":
         """Async context manager entry."""
@@ -37,9 +47,13 @@ class BlockchainExtractor(LoggerMixin):
         timestamp: int,
         tx_id: str,
         collector: List[Dict[str, Any]],
-        vip_functions: Optional[List[str]] = None,
+        vip_functions: AbstractSet[str] = frozenset(),
     ) -> None:
-        """Extract invoke transactions recursively.
+        """Extract nested invoke transactions, depth first.
+
+        Walks the invoke tree with an explicit stack instead of recursion,
+        so deep dApp call chains cannot hit the recursion limit. Matches are
+        collected in the same pre-order a recursive walk would produce.
 
         Args:
             invokes: List of invoke transactions
@@ -51,46 +65,49 @@ class BlockchainExtractor(LoggerMixin):
             collector: List to collect matching transactions
             vip_functions: Important function names to always include
         """
-        vip_functions = vip_functions or []
-
-        for invoke in invokes:
-            invoke["sender"] = sender
-            invoke["height"] = height
-            invoke["timestamp"] = timestamp
-            invoke["type"] = 16
-            invoke["id"] = tx_id
+        collect = collector.append
+        # Fields stamped on every collected invoke of this transaction
+        tx_fields = {"height": height, "timestamp": timestamp, "type": 16, "id": tx_id}
+
+        # Each frame is an iterator over one level of invokes and the dApp
+        # that issued them
+        stack = [(iter(invokes), sender)]
+        while stack:
+            level, level_sender = stack[-1]
+            invoke = next(level, None)
+            if invoke is None:
+                stack.pop()
+                continue
 
             try:
-                if (
-                    invoke["dApp"] == target_address
+                d_app = invoke["dApp"]
+                matched = (
+                    d_app == target_address
                     or invoke["call"]["function"] in vip_functions
-                ):
-                    collector.append(invoke)
+                )
             except KeyError as e:
                 self.logger.error(
                     "Invalid invoke structure", invoke=invoke, error=str(e)
                 )
                 continue
 
-            # Recursively process nested invokes
+            # Only invokes that are kept get the transaction fields; the
+            # rest of the tree is walked but left untouched
+            if matched:
+                invoke["sender"] = level_sender
+                invoke.update(tx_fields)
+                collect(invoke)
+
+            # Descend into nested invokes before the next sibling
             nested_invokes = invoke.get("stateChanges", {}).get("invokes", [])
             if nested_invokes:
-                self._extract_invokes(
-                    nested_invokes,
-                    target_address,
-                    invoke["dApp"],
-                    height,
-                    timestamp,
-                    tx_id,
-                    collector,
-                    vip_functions,
-                )
+                stack.append((iter(nested_invokes), d_app))
 
     def _find_relevant_transactions(
         self,
         transaction: Dict[str, Any],
         target_address: str,
-        vip_functions: Optional[List[str]] = None,
+        vip_functions: AbstractSet[str] = frozenset(),
     ) -> List[Dict[str, Any]]:
         """Find transactions relevant to the target address.
 
@@ -102,8 +119,7 @@ class BlockchainExtractor(LoggerMixin):
         Returns:
             List of relevant transactions
         """
-        relevant_txs = []
-        vip_functions = vip_functions or []
+        relevant_txs: List[Dict[str, Any]] = []
 
         # Skip failed transactions
         if transaction.get("applicationStatus") != "succeeded":
@@ -183,14 +199,20 @@ class BlockchainExtractor(LoggerMixin):
                 after=after,
             )
 
-            # Filter out already processed transactions
+            # Pages run newest first, so everything from the last processed
+            # transaction on was seen by a previous run. Cutting the page
+            # short also ends pagination via has_more.
             if last_processed_id:
-                filtered_txs = []
-                for tx in transactions:
-                    if tx["id"] == last_processed_id:
-                        break
-                    filtered_txs.append(tx)
-                transactions = filtered_txs
+                cut = next(
+                    (
+                        i
+                        for i, tx in enumerate(transactions)
+                        if tx["id"] == last_processed_id
+                    ),
+                    None,
+                )
+                if cut is not None:
+                    transactions = transactions[:cut]
 
             has_more = len(transactions) == limit
 
@@ -231,34 +253,47 @@ class BlockchainExtractor(LoggerMixin):
             function_name=function_name,
         )
 
+        next_page: Optional[asyncio.Task] = None
         try:
+            # Hashed once per run; checked for every (nested) invoke
+            vip_set = frozenset(vip_functions or ())
             all_transactions = []
-            last_tx_id = ""
-            has_more = True
             file_count = 0
             total_count = 0
 
-            while has_more:
-                batch, has_more = await self.fetch_transactions_batch(
-                    address=address,
-                    after=last_tx_id,
-                    last_processed_id=last_processed_id,
+            def fetch_page(
+                after: str,
+            ) -> "asyncio.Task[Tuple[List[Dict[str, Any]], bool]]":
+                return asyncio.create_task(
+                    self.fetch_transactions_batch(
+                        address=address,
+                        after=after,
+                        last_processed_id=last_processed_id,
+                    )
                 )
 
+            next_page = fetch_page("")
+            while next_page is not None:
+                batch, has_more = await next_page
+                next_page = None
+
                 if not batch:
                     break
 
-                # Process transactions to find relevant ones
-                relevant_txs = []
-                for tx in batch:
-                    found_txs = self._find_relevant_transactions(
-                        tx, address, vip_functions
-                    )
-                    relevant_txs.extend(found_txs)
+                # Pages chain on the last ID, so request the next one before
+                # scanning this one; yielding once lets the request go out
+                # while the scan below runs
+                if has_more:
+                    next_page = fetch_page(batch[-1]["id"])
+                    await asyncio.sleep(0)
 
-                all_transactions.extend(relevant_txs)
-                total_count += len(relevant_txs)
-                last_tx_id = batch[-1]["id"]
+                # Collect relevant transactions straight into the buffer
+                buffered = len(all_transactions)
+                find_relevant = self._find_relevant_transactions
+                for tx in batch:
+                    all_transactions.extend(find_relevant(tx, address, vip_set))
+                relevant_count = len(all_transactions) - buffered
+                total_count += relevant_count
 
                 # Check memory limits
                 if len(all_transactions) > settings.max_transactions_in_memory:
@@ -271,7 +306,7 @@ class BlockchainExtractor(LoggerMixin):
                 self.logger.info(
                     "Processed batch",
                     batch_size=len(batch),
-                    relevant_count=len(relevant_txs),
+                    relevant_count=relevant_count,
                     total_count=total_count,
                 )
 
@@ -299,23 +334,31 @@ class BlockchainExtractor(LoggerMixin):
             self.log_error(context, e)
             raise
 
+        finally:
+            # Don't leave a prefetched page running if the scan failed
+            if next_page is not None:
+                next_page.cancel()
+
     async def _save_transactions_to_file(
         self,
         transactions: List[Dict[str, Any]],
         address: str,
         file_index: int,
     ) -> None:
-        """Save transactions to a temporary file.
+        """Save transactions to a temporary compressed NDJSON file.
 
         Args:
             transactions: List of transactions
             address: Address identifier
             file_index: File index number
         """
-        filename = f"tmp/{address}_{file_index}"
+        filename = f"tmp/{address}_{file_index}{NDJSON_SUFFIX}"
 
-        async with aiofiles.open(filename, "w") as f:
-            await f.write(json.dumps(transactions))
+        # One line per transaction, encoded and compressed in a worker
+        # thread so the event loop keeps serving page fetches. Batches arrive
+        # newest first; writing them back to front stores each file in
+        # chronological order.
+        await asyncio.to_thread(write_ndjson, filename, reversed(transactions))
 
         self.logger.info(
             "Saved transactions to file",
@@ -341,20 +384,18 @@ class BlockchainExtractor(LoggerMixin):
 
         # Load files in reverse order (oldest first)
         for i in range(file_count - 1, -1, -1):
-            filename = f"tmp/{address}_{i}"
+            filename = f"tmp/{address}_{i}{NDJSON_SUFFIX}"
 
             try:
-                async with aiofiles.open(filename, "r") as f:
-                    content = await f.read()
-                    transactions = json.loads(content)
-                    transactions.reverse()  # Reverse for chronological order
-                    all_transactions.extend(transactions)
+                # Files are already in chronological order. Reading and
+                # decoding run in a worker thread, off the event loop.
+                all_transactions.extend(await asyncio.to_thread(load_ndjson, filename))
 
                 # Clean up file
-                import os
-
-                if os.path.exists(filename):
-                    os.remove(filename)
+                try:
+                    await aiofiles.os.remove(filename)
+                except FileNotFoundError:
+                    pass
 
             except Exception as e:
                 self.logger.error(
@@ -368,16 +409,30 @@ class BlockchainExtractor(LoggerMixin):
     async def get_asset_info(self, asset_id: str) -> Dict[str, Any]:
         """Get asset information from blockchain.
 
+        Results are cached for the lifetime of the extractor; failed lookups
+        are not cached and are retried on the next call.
+
         Args:
             asset_id: Asset ID
 
         Returns:
             Asset information
         """
+        cached = self._asset_cache.get(asset_id)
+        if cached is not None:
+            return cached
+
         if not self.http_client:
             raise RuntimeError("HTTP client not initialized")
 
-        return await self.http_client.get_asset_info(asset_id)
+        lock = self._asset_locks.setdefault(asset_id, asyncio.Lock())
+        async with lock:
+            # Another caller may have fetched it while we waited
+            cached = self._asset_cache.get(asset_id)
+            if cached is None:
+                cached = await self.http_client.get_asset_info(asset_id)
+                self._asset_cache[asset_id] = cached
+            return cached
 
     async def get_address_data(
         self, address: str, key_pattern: str = ""
@@ -1,14 +1,16 @@
 """Database loader module for saving processed data to PostgreSQL."""
 
+from contextlib import AsyncExitStack
 from datetime import datetime
 from decimal import Decimal
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Tuple, Type
 
-from sqlalchemy import func, select, update
-from sqlalchemy.dialects.postgresql import insert
-from sqlalchemy.ext.asyncio import AsyncSession
+import orjson
+from sqlalchemy import Table, func, select, update
+from sqlalchemy.dialects.postgresql import Insert, insert
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
 
-from puzzle_swap_etl.database import db_manager
+from puzzle_swap_etl.database import get_db_manager
 from puzzle_swap_etl.database.models_ods import (
     OdsAsset,
     OdsAssetPrice,
@@ -24,6 +26,7 @@ from puzzle_swap_etl.database.models_stg import (
     StgPriceData,
     StgTransaction,
 )
+from puzzle_swap_etl.mappings import AssetMapping
 from puzzle_swap_etl.models import AssetInfo, PoolInfo, StakingEventData, SwapData
 from puzzle_swap_etl.utils import LoggerMixin
 
@@ -43,28 +46,42 @@ class DatabaseLoader(LoggerMixin):
         )
 
         try:
-            async with db_manager.get_session() as session:
-                for tx_data in transactions:
-                    # Save to STG schema (raw data)
-                    stmt = insert(StgTransaction).values(
-                        id=tx_data["id"],
-                        height=tx_data["height"],
-                        timestamp=datetime.fromtimestamp(tx_data["timestamp"] / 1000),
-                        sender=tx_data["sender"],
-                        type=tx_data["type"],
-                        fee=(
-                            Decimal(tx_data.get("fee", 0)) / (10**8)
-                            if tx_data.get("fee")
-                            else None
-                        ),
-                        application_status=tx_data.get("applicationStatus"),
-                        raw_data=tx_data,
-                        processed=False,
-                    )
-                    stmt = stmt.on_conflict_do_nothing(index_elements=["id"])
-                    await session.execute(stmt)
-
-                await session.commit()
+            # Save to STG schema (raw data)
+            records = [
+                (
+                    tx_data["id"],
+                    tx_data["height"],
+                    datetime.fromtimestamp(tx_data["timestamp"] / 1000),
+                    tx_data["sender"],
+                    tx_data["type"],
+                    (
+                        Decimal(tx_data.get("fee", 0)) / (10**8)
+                        if tx_data.get("fee")
+                        else None
+                    ),
+                    tx_data.get("applicationStatus"),
+                    # COPY takes JSONB as text
+                    orjson.dumps(tx_data).decode(),
+                    False,
+                )
+                for tx_data in transactions
+            ]
+            await self._copy_records(
+                StgTransaction.__table__,
+                [
+                    "id",
+                    "height",
+                    "timestamp",
+                    "sender",
+                    "type",
+                    "fee",
+                    "application_status",
+                    "raw_data",
+                    "processed",
+                ],
+                records,
+                conflict_columns=["id"],
+            )
 
             self.log_success(context)
 
@@ -72,11 +89,14 @@ class DatabaseLoader(LoggerMixin):
             self.log_error(context, e)
             raise
 
-    async def save_swaps(self, swaps: List[SwapData]) -> None:
+    async def save_swaps(
+        self, swaps: List[SwapData], conn: Optional[AsyncConnection] = None
+    ) -> None:
         """Save swap data to ODS schema.
 
         Args:
             swaps: List of swap data
+            conn: Connection to reuse; a new one is opened if omitted
         """
         context = self.log_operation(
             "save_swaps",
@@ -84,33 +104,67 @@ class DatabaseLoader(LoggerMixin):
         )
 
         try:
-            async with db_manager.get_session() as session:
-                for swap_data in swaps:
-                    # Save to ODS schema (processed data)
-                    stmt = insert(OdsSwap).values(
-                        id=swap_data.id,
-                        transaction_id=swap_data.transaction_id,
-                        height=swap_data.height,
-                        timestamp=swap_data.timestamp,
-                        pool_address=swap_data.pool_address,
-                        trader_address=swap_data.trader_address,
-                        asset_in_id=swap_data.asset_in_id,
-                        asset_out_id=swap_data.asset_out_id,
-                        amount_in=swap_data.amount_in,
-                        amount_out=swap_data.amount_out,
-                        amount_in_usd=swap_data.amount_in_usd,
-                        amount_out_usd=swap_data.amount_out_usd,
-                        volume_usd=swap_data.volume_usd,
-                        pool_fee=swap_data.pool_fee,
-                        protocol_fee=swap_data.protocol_fee,
-                        owner_fee=getattr(swap_data, "owner_fee", None),
-                        swap_fee_rate=getattr(swap_data, "swap_fee_rate", None),
-                        price_impact=getattr(swap_data, "price_impact", None),
-                    )
-                    stmt = stmt.on_conflict_do_nothing(index_elements=["id"])
-                    await session.execute(stmt)
-
-                await session.commit()
+            records = [
+                (
+                    swap_data.id,
+                    swap_data.transaction_id,
+                    swap_data.height,
+                    swap_data.timestamp,
+                    swap_data.pool_address,
+                    swap_data.trader_address,
+                    swap_data.asset_in_id,
+                    swap_data.asset_out_id,
+                    swap_data.amount_in,
+                    swap_data.amount_out,
+                    AssetMapping.denormalize_amount(
+                        swap_data.asset_in_id, swap_data.amount_in
+                    ),
+                    AssetMapping.denormalize_amount(
+                        swap_data.asset_out_id, swap_data.amount_out
+                    ),
+                    swap_data.amount_in_usd,
+                    swap_data.amount_out_usd,
+                    swap_data.volume_usd,
+                    swap_data.pool_fee,
+                    swap_data.protocol_fee,
+                    getattr(swap_data, "price_impact", None),
+                    True,
+                    getattr(swap_data, "etl_batch_id", "default_batch"),
+                    "waves_blockchain",
+                )
+                for swap_data in swaps
+            ]
+
+            # Save to ODS schema (processed data)
+            await self._copy_records(
+                OdsSwap.__table__,
+                [
+                    "id",
+                    "transaction_id",
+                    "height",
+                    "timestamp",
+                    "pool_address",
+                    "trader_address",
+                    "asset_in_id",
+                    "asset_out_id",
+                    "amount_in",
+                    "amount_out",
+                    "amount_in_raw",
+                    "amount_out_raw",
+                    "amount_in_usd",
+                    "amount_out_usd",
+                    "volume_usd",
+                    "pool_fee",
+                    "protocol_fee",
+                    "price_impact",
+                    "is_valid",
+                    "etl_batch_id",
+                    "source_system",
+                ],
+                records,
+                conflict_columns=["id"],
+                conn=conn,
+            )
 
             self.log_success(context)
 
@@ -118,11 +172,14 @@ class DatabaseLoader(LoggerMixin):
             self.log_error(context, e)
             raise
 
-    async def save_staking_events(self, events: List[StakingEventData]) -> None:
+    async def save_staking_events(
+        self, events: List[StakingEventData], conn: Optional[AsyncConnection] = None
+    ) -> None:
         """Save staking events to ODS schema.
 
         Args:
             events: List of staking events
+            conn: Connection to reuse; a new one is opened if omitted
         """
         context = self.log_operation(
             "save_staking_events",
@@ -130,33 +187,51 @@ class DatabaseLoader(LoggerMixin):
         )
 
         try:
-            async with db_manager.get_session() as session:
-                for event_data in events:
-                    # Save to ODS schema (processed data)
-                    stmt = insert(OdsStakingEvent).values(
-                        id=event_data.id,
-                        transaction_id=event_data.transaction_id,
-                        height=event_data.height,
-                        timestamp=event_data.timestamp,
-                        staker_address=event_data.staker_address,
-                        event_type=event_data.event_type,
-                        amount=event_data.amount,
-                        amount_raw=getattr(
-                            event_data, "amount_raw", event_data.amount * 100000000
-                        ),  # Convert to raw amount
-                        amount_usd=event_data.amount_usd,
-                        total_staked_after=getattr(
-                            event_data, "total_staked_after", None
-                        ),
-                        reward_amount=getattr(event_data, "reward_amount", None),
-                        etl_batch_id=getattr(
-                            event_data, "etl_batch_id", "default_batch"
-                        ),
-                    )
-                    stmt = stmt.on_conflict_do_nothing(index_elements=["id"])
-                    await session.execute(stmt)
-
-                await session.commit()
+            records = [
+                (
+                    event_data.id,
+                    event_data.transaction_id,
+                    event_data.height,
+                    event_data.timestamp,
+                    event_data.staker_address,
+                    event_data.event_type,
+                    event_data.amount,
+                    getattr(
+                        event_data, "amount_raw", int(event_data.amount * 100000000)
+                    ),  # Convert to raw amount
+                    event_data.amount_usd,
+                    getattr(event_data, "total_staked_after", None),
+                    getattr(event_data, "reward_amount", None),
+                    True,
+                    getattr(event_data, "etl_batch_id", "default_batch"),
+                    "waves_blockchain",
+                )
+                for event_data in events
+            ]
+
+            # Save to ODS schema (processed data)
+            await self._copy_records(
+                OdsStakingEvent.__table__,
+                [
+                    "id",
+                    "transaction_id",
+                    "height",
+                    "timestamp",
+                    "staker_address",
+                    "event_type",
+                    "amount",
+                    "amount_raw",
+                    "amount_usd",
+                    "total_staked_after",
+                    "reward_amount",
+                    "is_valid",
+                    "etl_batch_id",
+                    "source_system",
+                ],
+                records,
+                conflict_columns=["id"],
+                conn=conn,
+            )
 
             self.log_success(context)
 
@@ -164,6 +239,102 @@ class DatabaseLoader(LoggerMixin):
             self.log_error(context, e)
             raise
 
+    async def _copy_records(
+        self,
+        table: Table,
+        columns: List[str],
+        records: List[Tuple[Any, ...]],
+        conflict_columns: List[str],
+        conn: Optional[AsyncConnection] = None,
+    ) -> None:
+        """Bulk insert records using the PostgreSQL COPY protocol.
+
+        Rows are copied into a temporary table first and then moved into
+        the target table, so existing rows are skipped just like with
+        ``ON CONFLICT DO NOTHING``.
+
+        Args:
+            table: Target table
+            columns: Column names, in the order of the record tuples
+            records: Rows to insert
+            conflict_columns: Columns of the unique constraint to skip on
+            conn: Connection to reuse; a new one is opened if omitted
+        """
+        if not records:
+            return
+
+        target = f"{table.schema}.{table.name}"
+        staging = f"tmp_copy_{table.name}"
+        column_list = ", ".join(columns)
+
+        async with AsyncExitStack() as stack:
+            if conn is None:
+                conn = await stack.enter_async_context(
+                    get_db_manager().get_connection()
+                )
+            raw_connection = await conn.get_raw_connection()
+            driver_connection = raw_connection.driver_connection
+
+            # The staging table is dropped explicitly rather than ON COMMIT,
+            # since a reused connection may already be inside a transaction.
+            async with driver_connection.transaction():
+                await driver_connection.execute(
+                    f"CREATE TEMP TABLE {staging} AS "
+                    f"SELECT {column_list} FROM {target} WITH NO DATA"
+                )
+                await driver_connection.copy_records_to_table(
+                    staging, records=records, columns=columns
+                )
+                await driver_connection.execute(
+                    f"INSERT INTO {target} ({column_list}) "
+                    f"SELECT {column_list} FROM {staging} "
+                    f"ON CONFLICT ({', '.join(conflict_columns)}) DO NOTHING"
+                )
+                await driver_connection.execute(f"DROP TABLE {staging}")
+
+    async def _execute_many(self, stmt: Insert, rows: List[Dict[str, Any]]) -> None:
+        """Execute an INSERT for many rows in one transaction.
+
+        Runs on a Core connection, where SQLAlchemy packs the rows into
+        batched multi-row VALUES statements instead of one round trip per
+        row. Unlike an ORM bulk insert, None values are sent as NULL.
+
+        Args:
+            stmt: INSERT statement without values
+            rows: Column values, one dict per row
+        """
+        if not rows:
+            return
+
+        async with get_db_manager().get_connection() as conn:
+            await conn.execute(stmt, rows)
+            await conn.commit()
+
+    def _upsert(
+        self, model: Type[Any], index_elements: List[str], update_columns: List[str]
+    ) -> Insert:
+        """Build an ``INSERT ... ON CONFLICT DO UPDATE`` statement.
+
+        The statement carries no values, so it can be executed with a whole
+        batch of rows in one round trip.
+
+        Args:
+            model: ORM model of the target table
+            index_elements: Columns of the unique constraint to upsert on
+            update_columns: Columns overwritten with the incoming values
+
+        Returns:
+            Upsert statement that also bumps ``updated_at``
+        """
+        stmt = insert(model)
+        return stmt.on_conflict_do_update(
+            index_elements=index_elements,
+            set_={
+                **{column: stmt.excluded[column] for column in update_columns},
+                "updated_at": func.now(),
+            },
+        )
+
     async def save_assets(self, assets: List[AssetInfo]) -> None:
         """Save asset information to STG schema.
 
@@ -176,26 +347,25 @@ class DatabaseLoader(LoggerMixin):
         )
 
         try:
-            async with db_manager.get_session() as session:
-                for asset_data in assets:
-                    # Save to STG schema (raw data)
-                    stmt = insert(StgAssetInfo).values(
-                        id=asset_data.id,
-                        name=asset_data.name,
-                        symbol=getattr(asset_data, "symbol", None),
-                        decimals=asset_data.decimals,
-                        description=getattr(asset_data, "description", None),
-                        issuer=getattr(asset_data, "issuer", None),
-                        total_supply=getattr(asset_data, "total_supply", None),
-                        reissuable=getattr(asset_data, "reissuable", None),
-                        raw_data=(
-                            asset_data.dict() if hasattr(asset_data, "dict") else {}
-                        ),
-                    )
-                    stmt = stmt.on_conflict_do_nothing(index_elements=["id"])
-                    await session.execute(stmt)
-
-                await session.commit()
+            # Save to STG schema (raw data)
+            rows = [
+                {
+                    "id": asset_data.id,
+                    "name": asset_data.name,
+                    "symbol": getattr(asset_data, "symbol", None),
+                    "decimals": asset_data.decimals,
+                    "description": getattr(asset_data, "description", None),
+                    "issuer": getattr(asset_data, "issuer", None),
+                    "total_supply": getattr(asset_data, "total_supply", None),
+                    "reissuable": getattr(asset_data, "reissuable", None),
+                    "raw_data": (
+                        asset_data.dict() if hasattr(asset_data, "dict") else {}
+                    ),
+                }
+                for asset_data in assets
+            ]
+            stmt = insert(StgAssetInfo).on_conflict_do_nothing(index_elements=["id"])
+            await self._execute_many(stmt, rows)
 
             self.log_success(context)
 
@@ -215,22 +385,23 @@ class DatabaseLoader(LoggerMixin):
         )
 
         try:
-            async with db_manager.get_session() as session:
-                for pool_data in pools:
-                    # Save to STG schema (raw data)
-                    stmt = insert(StgPoolInfo).values(
-                        address=pool_data.address,
-                        asset_a_id=pool_data.asset_a_id,
-                        asset_b_id=pool_data.asset_b_id,
-                        name=getattr(pool_data, "name", None),
-                        fee_rate=getattr(pool_data, "fee_rate", None),
-                        active=getattr(pool_data, "active", True),
-                        raw_data=pool_data.dict() if hasattr(pool_data, "dict") else {},
-                    )
-                    stmt = stmt.on_conflict_do_nothing(index_elements=["address"])
-                    await session.execute(stmt)
-
-                await session.commit()
+            # Save to STG schema (raw data)
+            rows = [
+                {
+                    "address": pool_data.address,
+                    "asset_a_id": pool_data.asset_a_id,
+                    "asset_b_id": pool_data.asset_b_id,
+                    "name": getattr(pool_data, "name", None),
+                    "fee_rate": getattr(pool_data, "fee_rate", None),
+                    "active": getattr(pool_data, "active", True),
+                    "raw_data": pool_data.dict() if hasattr(pool_data, "dict") else {},
+                }
+                for pool_data in pools
+            ]
+            stmt = insert(StgPoolInfo).on_conflict_do_nothing(
+                index_elements=["address"]
+            )
+            await self._execute_many(stmt, rows)
 
             self.log_success(context)
 
@@ -250,19 +421,18 @@ class DatabaseLoader(LoggerMixin):
         )
 
         try:
-            async with db_manager.get_session() as session:
-                for price_info in price_data:
-                    # Save to STG schema (raw data)
-                    stmt = insert(StgPriceData).values(
-                        asset_id=price_info["asset_id"],
-                        price_usd=price_info["price_usd"],
-                        source=price_info["source"],
-                        raw_response=price_info.get("raw_response", {}),
-                        fetched_at=price_info["fetched_at"],
-                    )
-                    await session.execute(stmt)
-
-                await session.commit()
+            # Save to STG schema (raw data)
+            rows = [
+                {
+                    "asset_id": price_info["asset_id"],
+                    "price_usd": price_info["price_usd"],
+                    "source": price_info["source"],
+                    "raw_response": price_info.get("raw_response", {}),
+                    "fetched_at": price_info["fetched_at"],
+                }
+                for price_info in price_data
+            ]
+            await self._execute_many(insert(StgPriceData), rows)
 
             self.log_success(context)
 
@@ -282,20 +452,18 @@ class DatabaseLoader(LoggerMixin):
         )
 
         try:
-            async with db_manager.get_session() as session:
+            async with get_db_manager().get_session() as session:
                 for pair_data in pairs:
                     stmt = insert(OdsSwapPair).values(
                         asset_a_id=pair_data["asset_a_id"],
                         asset_b_id=pair_data["asset_b_id"],
                         pool_address=pair_data["pool_address"],
-                        pair_name=pair_data.get("pair_name"),
                         fee_rate=pair_data.get("fee_rate"),
                         active=pair_data.get("active", True),
                     )
                     stmt = stmt.on_conflict_do_update(
                         index_elements=["asset_a_id", "asset_b_id", "pool_address"],
                         set_=dict(
-                            pair_name=stmt.excluded.pair_name,
                             fee_rate=stmt.excluded.fee_rate,
                             active=stmt.excluded.active,
                             updated_at=func.now(),
@@ -325,24 +493,23 @@ class DatabaseLoader(LoggerMixin):
         )
 
         try:
-            async with db_manager.get_session() as session:
-                for allocation_data in allocations:
-                    stmt = insert(OdsProtocolAllocation).values(
-                        protocol_address=allocation_data["protocol_address"],
-                        protocol_name=allocation_data["protocol_name"],
-                        protocol_type=allocation_data["protocol_type"],
-                        asset_id=allocation_data["asset_id"],
-                        amount=Decimal(str(allocation_data["amount"])),
-                        amount_usd=(
-                            Decimal(str(allocation_data["amount_usd"]))
-                            if allocation_data.get("amount_usd")
-                            else None
-                        ),
-                        timestamp=allocation_data["timestamp"],
-                    )
-                    await session.execute(stmt)
-
-                await session.commit()
+            rows = [
+                {
+                    "protocol_address": allocation_data["protocol_address"],
+                    "protocol_name": allocation_data["protocol_name"],
+                    "protocol_type": allocation_data["protocol_type"],
+                    "asset_id": allocation_data["asset_id"],
+                    "amount": Decimal(str(allocation_data["amount"])),
+                    "amount_usd": (
+                        Decimal(str(allocation_data["amount_usd"]))
+                        if allocation_data.get("amount_usd")
+                        else None
+                    ),
+                    "timestamp": allocation_data["timestamp"],
+                }
+                for allocation_data in allocations
+            ]
+            await self._execute_many(insert(OdsProtocolAllocation), rows)
 
             self.log_success(context)
 
@@ -362,7 +529,7 @@ class DatabaseLoader(LoggerMixin):
         )
 
         try:
-            async with db_manager.get_session() as session:
+            async with get_db_manager().get_session() as session:
                 stmt = (
                     update(StgTransaction)
                     .where(StgTransaction.id.in_(transaction_ids))
@@ -389,39 +556,39 @@ class DatabaseLoader(LoggerMixin):
         )
 
         try:
-            async with db_manager.get_session() as session:
-                for asset_data in assets:
-                    # Save to ODS schema (processed data)
-                    stmt = insert(OdsAsset).values(
-                        id=asset_data.id,
-                        name=asset_data.name,
-                        symbol=getattr(asset_data, "symbol", asset_data.name[:10]),
-                        decimals=asset_data.decimals,
-                        description=getattr(asset_data, "description", None),
-                        issuer=getattr(asset_data, "issuer", None),
-                        total_supply=getattr(asset_data, "total_supply", None),
-                        reissuable=getattr(asset_data, "reissuable", False),
-                        asset_type=getattr(asset_data, "asset_type", "token"),
-                        is_verified=getattr(asset_data, "is_verified", False),
-                        etl_batch_id="default_batch",
-                    )
-                    stmt = stmt.on_conflict_do_update(
-                        index_elements=["id"],
-                        set_=dict(
-                            name=stmt.excluded.name,
-                            symbol=stmt.excluded.symbol,
-                            description=stmt.excluded.description,
-                            issuer=stmt.excluded.issuer,
-                            total_supply=stmt.excluded.total_supply,
-                            reissuable=stmt.excluded.reissuable,
-                            asset_type=stmt.excluded.asset_type,
-                            is_verified=stmt.excluded.is_verified,
-                            updated_at=func.now(),
-                        ),
-                    )
-                    await session.execute(stmt)
-
-                await session.commit()
+            # Save to ODS schema (processed data). Keyed by ID, as a
+            # multi-row upsert cannot update the same row twice.
+            rows = {
+                asset_data.id: {
+                    "id": asset_data.id,
+                    "name": asset_data.name,
+                    "symbol": getattr(asset_data, "symbol", asset_data.name[:10]),
+                    "decimals": asset_data.decimals,
+                    "description": getattr(asset_data, "description", None),
+                    "issuer": getattr(asset_data, "issuer", None),
+                    "total_supply": getattr(asset_data, "total_supply", None),
+                    "reissuable": getattr(asset_data, "reissuable", False),
+                    "asset_type": getattr(asset_data, "asset_type", "token"),
+                    "is_verified": getattr(asset_data, "is_verified", False),
+                    "etl_batch_id": "default_batch",
+                }
+                for asset_data in assets
+            }
+            stmt = self._upsert(
+                OdsAsset,
+                ["id"],
+                [
+                    "name",
+                    "symbol",
+                    "description",
+                    "issuer",
+                    "total_supply",
+                    "reissuable",
+                    "asset_type",
+                    "is_verified",
+                ],
+            )
+            await self._execute_many(stmt, list(rows.values()))
 
             self.log_success(context)
 
@@ -441,39 +608,39 @@ class DatabaseLoader(LoggerMixin):
         )
 
         try:
-            async with db_manager.get_session() as session:
-                for pool_data in pools:
-                    # Save to ODS schema (processed data)
-                    stmt = insert(OdsPool).values(
-                        address=pool_data.address,
-                        asset_a_id=pool_data.asset_a_id,
-                        asset_b_id=pool_data.asset_b_id,
-                        name=getattr(
-                            pool_data,
-                            "name",
-                            f"{pool_data.asset_a_id}/{pool_data.asset_b_id}",
-                        ),
-                        fee_rate=getattr(pool_data, "fee_rate", Decimal("0.003")),
-                        active=getattr(pool_data, "active", True),
-                        total_volume_usd=Decimal("0"),
-                        total_swaps=0,
-                        etl_batch_id="default_batch",
-                    )
-                    stmt = stmt.on_conflict_do_update(
-                        index_elements=["address"],
-                        set_=dict(
-                            name=stmt.excluded.name,
-                            fee_rate=stmt.excluded.fee_rate,
-                            active=stmt.excluded.active,
-                            total_volume_usd=stmt.excluded.total_volume_usd,
-                            total_swaps=stmt.excluded.total_swaps,
-                            etl_batch_id=stmt.excluded.etl_batch_id,
-                            updated_at=func.now(),
-                        ),
-                    )
-                    await session.execute(stmt)
-
-                await session.commit()
+            # Save to ODS schema (processed data). Keyed by address, as a
+            # multi-row upsert cannot update the same row twice.
+            rows = {
+                pool_data.address: {
+                    "address": pool_data.address,
+                    "asset_a_id": pool_data.asset_a_id,
+                    "asset_b_id": pool_data.asset_b_id,
+                    "name": getattr(
+                        pool_data,
+                        "name",
+                        f"{pool_data.asset_a_id}/{pool_data.asset_b_id}",
+                    ),
+                    "fee_rate": getattr(pool_data, "fee_rate", Decimal("0.003")),
+                    "active": getattr(pool_data, "active", True),
+                    "total_volume_usd": Decimal("0"),
+                    "total_swaps": 0,
+                    "etl_batch_id": "default_batch",
+                }
+                for pool_data in pools
+            }
+            stmt = self._upsert(
+                OdsPool,
+                ["address"],
+                [
+                    "name",
+                    "fee_rate",
+                    "active",
+                    "total_volume_usd",
+                    "total_swaps",
+                    "etl_batch_id",
+                ],
+            )
+            await self._execute_many(stmt, list(rows.values()))
 
             self.log_success(context)
 
@@ -486,7 +653,7 @@ class DatabaseLoader(LoggerMixin):
         context = self.log_operation("calculate_and_save_aggregated_data")
 
         try:
-            async with db_manager.get_session() as session:
+            async with get_db_manager().get_session() as session:
                 # Calculate swap pair statistics
                 await self._calculate_swap_pair_stats(session)
 
@@ -520,31 +687,33 @@ class DatabaseLoader(LoggerMixin):
             .group_by(OdsSwap.asset_in_id, OdsSwap.asset_out_id, OdsSwap.pool_address)
         )
 
+        # Normalize asset pair order (smaller asset ID first). Both swap
+        # directions map to the same pair; the last one seen wins, as a
+        # single multi-row upsert cannot touch the same row twice.
+        pairs = {}
         for row in result:
-            # Normalize asset pair order (smaller asset ID first)
             asset_a_id = min(row.asset_in_id, row.asset_out_id)
             asset_b_id = max(row.asset_in_id, row.asset_out_id)
-
-            # Upsert swap pair statistics
-            stmt = insert(OdsSwapPair).values(
-                asset_a_id=asset_a_id,
-                asset_b_id=asset_b_id,
-                pool_address=row.pool_address,
-                pair_name=f"{asset_a_id[:8]}/{asset_b_id[:8]}",
-                total_volume_usd=row.total_volume_usd or Decimal("0"),
-                swap_count=row.total_swaps,
-                fee_rate=Decimal("0.003"),  # Default fee rate
-                is_active=True,
-            )
-            stmt = stmt.on_conflict_do_update(
-                index_elements=["asset_a_id", "asset_b_id", "pool_address"],
-                set_=dict(
-                    swap_count=stmt.excluded.swap_count,
-                    total_volume_usd=stmt.excluded.total_volume_usd,
-                    updated_at=func.now(),
-                ),
-            )
-            await session.execute(stmt)
+            pairs[(asset_a_id, asset_b_id, row.pool_address)] = {
+                "asset_a_id": asset_a_id,
+                "asset_b_id": asset_b_id,
+                "pool_address": row.pool_address,
+                "total_volume_usd": row.total_volume_usd or Decimal("0"),
+                "swap_count": row.total_swaps,
+                "fee_rate": Decimal("0.003"),  # Default fee rate
+                "is_active": True,
+            }
+
+        if not pairs:
+            return
+
+        # Upsert swap pair statistics in batched multi-row statements
+        stmt = self._upsert(
+            OdsSwapPair,
+            ["asset_a_id", "asset_b_id", "pool_address"],
+            ["swap_count", "total_volume_usd"],
+        )
+        await session.execute(stmt, list(pairs.values()))
 
     async def _calculate_asset_price_stats(self, session: AsyncSession) -> None:
         """Calculate asset price statistics from price data."""
@@ -557,19 +726,24 @@ class DatabaseLoader(LoggerMixin):
             ).group_by(StgPriceData.asset_id)
         )
 
-        for row in result:
-            # Upsert asset price statistics
-            stmt = insert(OdsAssetPrice).values(
-                asset_id=row.asset_id,
-                timestamp=row.last_update,
-                price_usd=row.avg_price or Decimal("0"),
-                source="aggregated",
-                volume_24h=Decimal("0"),  # Would need additional calculation
-                market_cap=None,
-            )
-            # Note: OdsAssetPrice uses auto-increment ID, so we can't use on_conflict_do_update easily
-            # We'll just insert new records for now
-            await session.execute(stmt)
+        prices = [
+            {
+                "asset_id": row.asset_id,
+                "timestamp": row.last_update,
+                "price_usd": row.avg_price or Decimal("0"),
+                "source": "aggregated",
+                "volume_24h": Decimal("0"),  # Would need additional calculation
+                "market_cap": None,
+            }
+            for row in result
+        ]
+
+        if not prices:
+            return
+
+        # Note: OdsAssetPrice uses auto-increment ID, so we can't use on_conflict_do_update easily
+        # We'll just insert new records for now, in batched multi-row statements
+        await session.execute(insert(OdsAssetPrice), prices)
 
     async def _calculate_protocol_allocation_stats(self, session: AsyncSession) -> None:
         """Calculate protocol allocation statistics."""
@@ -577,31 +751,29 @@ class DatabaseLoader(LoggerMixin):
         # Since we don't have protocol_address and asset_id in staking events,
         # we'll calculate general staking statistics
 
-        # Get stake events
-        stake_result = await session.execute(
+        # Get stake and unstake totals in a single pass over staking events
+        is_stake = OdsStakingEvent.event_type == "stake"
+        result = await session.execute(
             select(
-                func.sum(OdsStakingEvent.amount).label("total_staked"),
-                func.count(func.distinct(OdsStakingEvent.staker_address)).label(
-                    "unique_stakers"
-                ),
-                func.count().label("stake_events"),
-                func.max(OdsStakingEvent.timestamp).label("last_update"),
-            ).where(OdsStakingEvent.event_type == "stake")
-        )
-
-        # Get unstake events
-        unstake_result = await session.execute(
-            select(func.sum(OdsStakingEvent.amount).label("total_unstaked")).where(
-                OdsStakingEvent.event_type == "unstake"
-            )
+                func.sum(OdsStakingEvent.amount).filter(is_stake).label("total_staked"),
+                func.count(func.distinct(OdsStakingEvent.staker_address))
+                .filter(is_stake)
+                .label("unique_stakers"),
+                func.count().filter(is_stake).label("stake_events"),
+                func.max(OdsStakingEvent.timestamp)
+                .filter(is_stake)
+                .label("last_update"),
+                func.sum(OdsStakingEvent.amount)
+                .filter(OdsStakingEvent.event_type == "unstake")
+                .label("total_unstaked"),
+            ).where(OdsStakingEvent.event_type.in_(["stake", "unstake"]))
         )
 
-        stake_row = stake_result.first()
-        unstake_row = unstake_result.first()
+        stake_row = result.first()
 
         if stake_row and stake_row.total_staked and stake_row.total_staked > 0:
             total_staked = stake_row.total_staked - (
-                unstake_row.total_unstaked or Decimal("0")
+                stake_row.total_unstaked or Decimal("0")
             )
 
             # Create a general protocol allocation record
@@ -2,6 +2,14 @@
 
 from .http import HTTPClient, retry_async
 from .logging import LoggerMixin, get_logger, setup_logging
+from .ndjson import (
+    NDJSON_SUFFIX,
+    ZSTD_LEVEL,
+    dump_ndjson,
+    load_ndjson,
+    read_ndjson_batches,
+    write_ndjson,
+)
 
 __all__ = [
     "HTTPClient",
@@ -9,4 +17,10 @@ __all__ = [
     "LoggerMixin",
     "get_logger",
     "setup_logging",
+    "NDJSON_SUFFIX",
+    "ZSTD_LEVEL",
+    "dump_ndjson",
+    "load_ndjson",
+    "read_ndjson_batches",
+    "write_ndjson",
 ]
@@ -4,6 +4,7 @@ import asyncio
 from typing import Any, Dict, List, Optional
 
 import aiohttp
+import orjson
 from aiohttp import ClientTimeout
 
 from puzzle_swap_etl.config import settings
@@ -24,7 +25,15 @@ class HTTPClient(LoggerMixin):
 
     async def __aenter__(self) -> "HTTPClient":
         """Async context manager entry."""
-        self.session = aiohttp.ClientSession(timeout=self.timeout)
+        # One keep-alive pool shared by all concurrent requests of this client.
+        # Idle connections and resolved node addresses are kept long enough
+        # to survive the gaps between paginated requests.
+        connector = aiohttp.TCPConnector(
+            limit=settings.worker_threads * 4,
+            keepalive_timeout=60,
+            ttl_dns_cache=300,
+        )
+        self.session = aiohttp.ClientSession(timeout=self.timeout, connector=connector)
         return self
 
     async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
@@ -53,7 +62,9 @@ class HTTPClient(LoggerMixin):
         try:
             async with self.session.get(url, **kwargs) as response:
                 response.raise_for_status()
-                data = await response.json()
+                # Decoded straight from the body bytes, without building an
+                # intermediate str of the (often multi-megabyte) payload
+                data = orjson.loads(await response.read())
                 self.log_success(context, status=response.status)
                 return data
         except Exception as e:
@@ -0,0 +1,101 @@
+"""Zstd-compressed NDJSON files for the pipeline's intermediate data."""
+
+import io
+from pathlib import Path
+from typing import Any, AsyncIterator, Callable, Iterable, List, Union
+
+import aiofiles
+import orjson
+import zstandard
+
+# Suffix and compression level shared by every intermediate file, so files
+# written by one stage are always readable by the next
+NDJSON_SUFFIX = ".ndjson.zst"
+ZSTD_LEVEL = 3
+
+# Read size for intermediate files
+_IO_CHUNK_SIZE = 1 << 20
+
+PathLike = Union[str, Path]
+
+
+def dump_ndjson(records: Iterable[Any]) -> bytes:
+    """Serialize records as newline-delimited JSON.
+
+    Args:
+        records: JSON-serializable records
+
+    Returns:
+        Encoded NDJSON chunk, one record per line
+    """
+    return b"".join(
+        orjson.dumps(record, default=str, option=orjson.OPT_APPEND_NEWLINE)
+        for record in records
+    )
+
+
+def write_ndjson(path: PathLike, records: Iterable[Any]) -> None:
+    """Write records to a zstd-compressed NDJSON file as a single frame.
+
+    Args:
+        path: Destination file
+        records: JSON-serializable records, in file order
+    """
+    payload = dump_ndjson(records)
+    Path(path).write_bytes(zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(payload))
+
+
+def load_ndjson(path: PathLike) -> List[Any]:
+    """Read and decode a whole zstd-compressed NDJSON file.
+
+    Args:
+        path: File to read
+
+    Returns:
+        Decoded records, in file order
+    """
+    decompressor = zstandard.ZstdDecompressor()
+    with io.BufferedReader(decompressor.stream_reader(open(path, "rb"))) as f:
+        return [orjson.loads(line) for line in f if line.strip()]
+
+
+async def read_ndjson_batches(
+    path: PathLike,
+    batch_size: int,
+    decode: Callable[[bytes], Any] = orjson.loads,
+) -> AsyncIterator[List[Any]]:
+    """Stream decoded records from a zstd-compressed NDJSON file in batches.
+
+    Args:
+        path: Compressed NDJSON file to read
+        batch_size: Maximum records per yielded batch
+        decode: Decoder applied to each line (e.g. a model's validate_json)
+
+    Yields:
+        Lists of decoded records
+    """
+    batch: List[Any] = []
+    pending = b""
+    decompressor = zstandard.ZstdDecompressor().decompressobj()
+    async with aiofiles.open(path, "rb") as f:
+        while True:
+            # Read large chunks rather than one thread-pool hop per line
+            raw = await f.read(_IO_CHUNK_SIZE)
+            chunk = decompressor.decompress(raw) if raw else b""
+            lines = (pending + chunk).split(b"\n")
+            # Carry the trailing partial line over to the next chunk
+            pending = lines.pop() if raw else b""
+
+            for line in lines:
+                if not line.strip():
+                    continue
+                batch.append(decode(line))
+                if len(batch) >= batch_size:
+                    yield batch
+                    batch = []
+
+            if not raw:
+                break
+
+    if batch:
+        yield batch
@@ -0,0 +1,168 @@
+"""Tests for extractor modules."""
+
+import pytest
+
+from puzzle_swap_etl.extractors.blockchain import BlockchainExtractor
+
+TARGET = "3PTargetDAppAddressxxxxxxxxxxxxxxxx"
+ROUTER = "3PRouterDAppAddressxxxxxxxxxxxxxxxx"
+OTHER = "3POtherDAppAddressxxxxxxxxxxxxxxxxx"
+USER = "3PUserAddressxxxxxxxxxxxxxxxxxxxxxx"
+
+STAMPED_FIELDS = ("sender", "height", "timestamp", "type", "id")
+
+
+def _invoke(d_app, function, nested=None):
+    """Build a nested invoke as returned by the node."""
+    invoke = {"dApp": d_app, "call": {"function": function, "args": []}}
+    if nested is not None:
+        invoke["stateChanges"] = {"invokes": nested}
+    return invoke
+
+
+def _transaction(nested):
+    """Build a succeeded invoke transaction issued through the router."""
+    return {
+        "id": "tx1",
+        "type": 16,
+        "height": 100,
+        "timestamp": 1700000000000,
+        "sender": USER,
+        "applicationStatus": "succeeded",
+        "dApp": ROUTER,
+        "call": {"function": "route", "args": []},
+        "stateChanges": {"invokes": nested},
+    }
+
+
+class FakeHTTPClient:
+    """Serves a fixed transaction page."""
+
+    def __init__(self, page):
+        self.page = page
+
+    async def get_waves_transactions(self, address, limit, after=None):
+        return list(self.page)
+
+
+class TestExtractInvokes:
+    """Test the nested invoke walker."""
+
+    @pytest.fixture
+    def tree(self):
+        """Invoke tree with matches and skips at several depths."""
+        self.deep_match = _invoke(TARGET, "swap")
+        self.deep_skip = _invoke(OTHER, "noop", [self.deep_match])
+        self.vip = _invoke(OTHER, "stakeFor", [self.deep_skip])
+        self.sibling_skip = _invoke(OTHER, "noop")
+        self.top_match = _invoke(TARGET, "swap", [self.vip, self.sibling_skip])
+        self.last_match = _invoke(TARGET, "claim")
+        return _transaction([self.top_match, self.last_match])
+
+    def test_collects_matches_in_depth_first_order(self, tree):
+        """Test matches at any depth are collected in pre-order."""
+        relevant = BlockchainExtractor()._find_relevant_transactions(
+            tree, TARGET, frozenset({"stakeFor"})
+        )
+
+        assert relevant == [self.top_match, self.vip, self.deep_match, self.last_match]
+
+    def test_vip_functions_at_depth(self, tree):
+        """Test VIP functions are collected regardless of dApp."""
+        without_vip = BlockchainExtractor()._find_relevant_transactions(
+            tree, TARGET, frozenset()
+        )
+
+        assert without_vip == [self.top_match, self.deep_match, self.last_match]
+
+    def test_stamps_collected_invokes(self, tree):
+        """Test collected invokes carry the transaction fields and caller."""
+        BlockchainExtractor()._find_relevant_transactions(
+            tree, TARGET, frozenset({"stakeFor"})
+        )
+
+        for invoke in (self.top_match, self.vip, self.deep_match, self.last_match):
+            assert invoke["height"] == 100
+            assert invoke["timestamp"] == 1700000000000
+            assert invoke["type"] == 16
+            assert invoke["id"] == "tx1"
+
+        assert self.top_match["sender"] == ROUTER
+        assert self.vip["sender"] == TARGET
+        assert self.deep_match["sender"] == OTHER
+        assert self.last_match["sender"] == ROUTER
+
+    def test_skipped_invokes_are_not_stamped(self, tree):
+        """Test invokes that are only walked through are left untouched."""
+        BlockchainExtractor()._find_relevant_transactions(
+            tree, TARGET, frozenset({"stakeFor"})
+        )
+
+        for invoke in (self.deep_skip, self.sibling_skip):
+            assert not any(field in invoke for field in STAMPED_FIELDS)
+
+    def test_invalid_invoke_is_skipped(self):
+        """Test a malformed invoke does not stop the walk."""
+        broken = {"call": {"function": "swap", "args": []}}
+        valid = _invoke(TARGET, "swap")
+        collector = []
+
+        BlockchainExtractor()._extract_invokes(
+            [broken, valid], TARGET, ROUTER, 100, 1700000000000, "tx1", collector
+        )
+
+        assert collector == [valid]
+        assert "height" not in broken
+
+
+class TestFetchTransactionsBatch:
+    """Test cutting pages at the last processed transaction."""
+
+    PAGE = [{"id": f"tx{i}"} for i in range(5)]
+
+    async def _fetch(self, last_processed_id):
+        extractor = BlockchainExtractor()
+        extractor.http_client = FakeHTTPClient(self.PAGE)
+        return await extractor.fetch_transactions_batch(
+            TARGET, limit=len(self.PAGE), last_processed_id=last_processed_id
+        )
+
+    @pytest.mark.asyncio
+    async def test_no_last_processed_id(self):
+        """Test a full page is returned and pagination continues."""
+        transactions, has_more = await self._fetch(None)
+
+        assert transactions == self.PAGE
+        assert has_more is True
+
+    @pytest.mark.asyncio
+    async def test_id_not_found(self):
+        """Test a page without the last processed id is kept whole."""
+        transactions, has_more = await self._fetch("unknown")
+
+        assert transactions == self.PAGE
+        assert has_more is True
+
+    @pytest.mark.asyncio
+    async def test_id_in_page(self):
+        """Test the page is cut before the last processed id."""
+        transactions, has_more = await self._fetch("tx2")
+
+        assert transactions == self.PAGE[:2]
+        assert has_more is False
+
+    @pytest.mark.asyncio
+    async def test_id_at_end(self):
+        """Test an id on the last row still ends pagination."""
+        transactions, has_more = await self._fetch("tx4")
+
+        assert transactions == self.PAGE[:4]
+        assert has_more is False
+
+    @pytest.mark.asyncio
+    async def test_id_at_start(self):
+        """Test an id on the first row yields an empty page."""
+        transactions, has_more = await self._fetch("tx0")
+
+        assert transactions == []
+        assert has_more is False
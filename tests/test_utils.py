@@ -0,0 +1,71 @@
+"""Tests for utility modules."""
+
+import random
+
+import pytest
+import zstandard
+
+from puzzle_swap_etl.utils import ndjson
+
+
+async def _collect(file_path, batch_size):
+    return [batch async for batch in ndjson.read_ndjson_batches(file_path, batch_size)]
+
+
+class TestNdjsonRoundTrip:
+    """Test writing and batched reading of intermediate NDJSON files."""
+
+    # Records of varying length, so lines fall across read chunks at
+    # different offsets
+    RECORDS = [{"id": i, "payload": "x" * (i * 7 % 50)} for i in range(103)]
+
+    @pytest.fixture(autouse=True)
+    def small_chunks(self, monkeypatch):
+        """Read a few bytes at a time so records straddle chunk boundaries."""
+        monkeypatch.setattr(ndjson, "_IO_CHUNK_SIZE", 16)
+
+    @pytest.mark.asyncio
+    async def test_round_trip(self, tmp_path):
+        """Test records survive a write and read in uneven batches."""
+        file_path = tmp_path / "records.ndjson.zst"
+        ndjson.write_ndjson(file_path, self.RECORDS)
+
+        batches = await _collect(file_path, 10)
+
+        assert [len(batch) for batch in batches] == [10] * 10 + [3]
+        assert [record for batch in batches for record in batch] == self.RECORDS
+
+    @pytest.mark.asyncio
+    async def test_final_line_without_newline(self, tmp_path):
+        """Test the last record is read when the file lacks a final newline."""
+        file_path = tmp_path / "records.ndjson.zst"
+        payload = ndjson.dump_ndjson(self.RECORDS).rstrip(b"\n")
+        file_path.write_bytes(zstandard.ZstdCompressor().compress(payload))
+
+        batches = await _collect(file_path, 25)
+
+        assert [len(batch) for batch in batches] == [25] * 4 + [3]
+        assert [record for batch in batches for record in batch] == self.RECORDS
+
+    @pytest.mark.asyncio
+    async def test_default_chunk_size(self, tmp_path, monkeypatch):
+        """Test records straddling a full-size read chunk."""
+        monkeypatch.setattr(ndjson, "_IO_CHUNK_SIZE", 1 << 20)
+        # Random payloads, so the compressed file spans several chunks
+        rng = random.Random(0)
+        records = [{"id": i, "payload": rng.randbytes(2048).hex()} for i in range(1000)]
+        file_path = tmp_path / "records.ndjson.zst"
+        ndjson.write_ndjson(file_path, records)
+        assert file_path.stat().st_size > 2 * ndjson._IO_CHUNK_SIZE
+
+        batches = await _collect(file_path, 300)
+
+        assert [len(batch) for batch in batches] == [300] * 3 + [100]
+        assert [record for batch in batches for record in batch] == records
+
+    def test_load_whole_file(self, tmp_path):
+        """Test the whole-file loader reads what the writer wrote."""
+        file_path = tmp_path / "records.ndjson.zst"
+        ndjson.write_ndjson(str(file_path), self.RECORDS)
+
+        assert ndjson.load_ndjson(str(file_path)) == self.RECORDS